@@ -0,0 +1,49 @@
+from django.http import HttpResponse
+from django.views import View
+
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated
+
+from users.authentication import aauthenticate
+from users.permissions import IsOwner
+
+from .renderers import ORJSONRenderer
+
+
+class AsyncOwnerView(View):
+    """
+    ASGI에서 스레드 전환 없이 실행되는 본인 데이터 조회용 async view
+
+    DRF APIView는 async handler를 지원하지 않으므로
+    인증(세션, JWT), 본인 확인(IsOwner), JSON 응답을 APIView와 같은 형태로 직접 처리
+    하위 클래스는 async def get(self, request, owner, ...)을 구현
+    """
+
+    http_method_names = ["get", "head"]
+
+    async def dispatch(self, request, *args, **kwargs):
+        user = await aauthenticate(request)
+        if user is None:
+            response = self.render(
+                {"detail": NotAuthenticated.default_detail},
+                status.HTTP_401_UNAUTHORIZED,
+            )
+            response["WWW-Authenticate"] = 'Bearer realm="api"'
+            return response
+        if kwargs.get("owner") != user.username:
+            return self.render({"detail": IsOwner.message}, status.HTTP_403_FORBIDDEN)
+
+        request.user = user
+        # DRF Request와 같이 query_params로 조회 (pagination 등 공용 코드)
+        request.query_params = request.GET
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            return self.render({"detail": exc.detail}, exc.status_code)
+
+    def render(self, data, status_code=status.HTTP_200_OK):
+        return HttpResponse(
+            ORJSONRenderer().render(data),
+            status=status_code,
+            content_type="application/json",
+        )
@@ -0,0 +1,128 @@
+import bisect
+import threading
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+from plans.cache import stats as plan_cache_stats
+
+# 응답 시간 histogram 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class ViewMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.seconds = 0.0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.serializer_seconds = 0.0
+        self.response_bytes = 0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+
+class MetricsRegistry:
+    """
+    view(route)별 요청 측정값 (프로세스 단위, 샘플링된 요청만 집계)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def observe(self, view, method, timings, response_bytes):
+        with self._lock:
+            metrics = self._views.setdefault((view, method), ViewMetrics())
+            metrics.requests += 1
+            metrics.seconds += timings.total
+            metrics.db_queries += timings.db_queries
+            metrics.db_seconds += timings.db_seconds
+            metrics.serializer_seconds += timings.serializer_seconds
+            metrics.response_bytes += response_bytes
+            index = bisect.bisect_left(LATENCY_BUCKETS, timings.total)
+            if index < len(LATENCY_BUCKETS):
+                metrics.buckets[index] += 1
+
+    def render(self):
+        """
+        Prometheus text format
+        """
+        with self._lock:
+            views = sorted(self._views.items())
+
+        lines = []
+
+        def family(name, kind, help_text, attribute):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (view, method), metrics in views:
+                lines.append(
+                    f'{name}{{view="{view}",method="{method}"}} '
+                    f"{getattr(metrics, attribute)}"
+                )
+
+        name = "budgetplan_request_duration_seconds"
+        lines.append(f"# HELP {name} Request wall time.")
+        lines.append(f"# TYPE {name} histogram")
+        for (view, method), metrics in views:
+            labels = f'view="{view}",method="{method}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, metrics.buckets):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {metrics.requests}')
+            lines.append(f"{name}_sum{{{labels}}} {metrics.seconds}")
+            lines.append(f"{name}_count{{{labels}}} {metrics.requests}")
+
+        family(
+            "budgetplan_db_queries_total",
+            "counter",
+            "DB queries executed.",
+            "db_queries",
+        )
+        family(
+            "budgetplan_db_seconds_total",
+            "counter",
+            "Time spent in DB queries.",
+            "db_seconds",
+        )
+        family(
+            "budgetplan_serializer_seconds_total",
+            "counter",
+            "Time spent in DRF serializers.",
+            "serializer_seconds",
+        )
+        family(
+            "budgetplan_response_bytes_total",
+            "counter",
+            "Response body size (non-streaming responses).",
+            "response_bytes",
+        )
+
+        name = "budgetplan_plan_cache_total"
+        cache_stats = plan_cache_stats.as_dict()
+        lines.append(f"# HELP {name} Plan summary cache lookups.")
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f'{name}{{result="hit"}} {cache_stats["hits"]}')
+        lines.append(f'{name}{{result="miss"}} {cache_stats["misses"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def metrics_view(request):
+    """
+    GET : 요청 측정값 조회 (Prometheus text format, 관리자 또는 METRICS_ALLOWED_IPS)
+    """
+    allowed_ips = getattr(settings, "METRICS_ALLOWED_IPS", [])
+    user = getattr(request, "user", None)
+    if request.META.get("REMOTE_ADDR") not in allowed_ips and not (
+        user and user.is_staff
+    ):
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,271 @@
+import contextlib
+import contextvars
+import random
+import re
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+from rest_framework import serializers
+
+from .metrics import registry
+from .queries import QueryInspector
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+_current_timings = contextvars.ContextVar("request_timings", default=None)
+
+re_accepts_br = re.compile(r"\bbr\b")
+
+
+class RequestTimings:
+    """
+    한 요청의 처리 시간, DB 쿼리 수/시간, 시리얼라이저 시간 (초)
+    """
+
+    def __init__(self):
+        self.total = 0.0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.serializer_seconds = 0.0
+
+    def db_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - started
+            self.db_queries += 1
+
+    def capture_queries(self):
+        """
+        현재 스레드의 DB 연결에 측정 wrapper를 설치 (반환한 ExitStack을 닫으면 해제)
+        """
+        stack = contextlib.ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self.db_wrapper))
+        return stack
+
+    def server_timing(self):
+        return ", ".join(
+            (
+                f"total;dur={self.total * 1000:.1f}",
+                f"db;dur={self.db_seconds * 1000:.1f};"
+                f'desc="{self.db_queries} queries"',
+                f"serializer;dur={self.serializer_seconds * 1000:.1f}",
+            )
+        )
+
+
+def _timed_data(data_property):
+    def data(self):
+        timings = _current_timings.get()
+        if timings is None:
+            return data_property.fget(self)
+
+        started = time.perf_counter()
+        try:
+            return data_property.fget(self)
+        finally:
+            timings.serializer_seconds += time.perf_counter() - started
+
+    return property(data)
+
+
+def install_serializer_timing():
+    """
+    DRF 시리얼라이저의 .data 계산 시간을 측정 중인 요청에 더하도록 설정 (한 번만)
+    """
+    for serializer_class in (serializers.Serializer, serializers.ListSerializer):
+        if not getattr(serializer_class, "_timed_data", False):
+            serializer_class.data = _timed_data(serializer_class.data)
+            serializer_class._timed_data = True
+
+
+class PerformanceMiddleware:
+    """
+    샘플링된 요청의 처리 시간, DB 쿼리 수/시간, 시리얼라이저 시간, 응답 크기를 측정해
+    Server-Timing 헤더로 반환하고 /metrics 에 집계
+
+    PERFORMANCE_SAMPLE_RATE (0~1) 비율의 요청만 측정하므로
+    나머지 요청은 난수 하나를 뽑는 것 외에 추가 비용이 없음
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "PERFORMANCE_SAMPLE_RATE", 0.05)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        install_serializer_timing()
+
+    def sampled(self):
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        started = time.perf_counter()
+        try:
+            with timings.capture_queries():
+                response = self.get_response(request)
+        finally:
+            timings.total = time.perf_counter() - started
+            _current_timings.reset(token)
+
+        return self.record(request, response, timings)
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        started = time.perf_counter()
+        # ASGI에서 ORM 쿼리는 요청별 sync 스레드에서 실행되므로 그 스레드의 연결에 설치
+        queries = await sync_to_async(timings.capture_queries)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(queries.close)()
+            timings.total = time.perf_counter() - started
+            _current_timings.reset(token)
+
+        return self.record(request, response, timings)
+
+    def record(self, request, response, timings):
+        match = request.resolver_match
+        view = match.route if match else "unmatched"
+        response_bytes = 0 if response.streaming else len(response.content)
+
+        response["Server-Timing"] = timings.server_timing()
+        registry.observe(view, request.method, timings, response_bytes)
+        return response
+
+
+class QueryInspectionMiddleware:
+    """
+    개발/스테이징용 쿼리 검사 (QUERY_INSPECTION = True 일 때만 사용)
+
+    요청마다 실행된 쿼리를 형태별로 모아 QUERY_N_PLUS_ONE_THRESHOLD번 이상 반복된
+    쿼리(N+1 의심)를 처음 실행한 view/serializer 위치와 함께,
+    QUERY_SLOW_MS 이상 걸린 쿼리를 "budgetplan.queries" 로거에 경고로 기록
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "QUERY_INSPECTION", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.n_plus_one_threshold = getattr(settings, "QUERY_N_PLUS_ONE_THRESHOLD", 5)
+        self.slow_query_ms = getattr(settings, "QUERY_SLOW_MS", 100)
+
+    def __call__(self, request):
+        inspector = QueryInspector(self.n_plus_one_threshold, self.slow_query_ms)
+        with contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(inspector))
+            response = self.get_response(request)
+
+        inspector.report(request)
+        return response
+
+
+def buffered(chunks, size):
+    """
+    작은 chunk들을 size 바이트 이상으로 모아서 반환 (압축 효율, flush 횟수 개선)
+    """
+    buffer = []
+    length = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield b"".join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Accept-Encoding에 따라 응답을 brotli(br) 또는 gzip으로 압축
+
+    COMPRESSION_MIN_LENGTH 바이트보다 작은 응답은 압축하지 않음
+    내보내기 같은 streaming 응답은 COMPRESSION_STREAM_BUFFER 바이트 단위로 압축해
+    전송하므로 전체 파일을 메모리에 올리지 않음
+    brotli가 설치되지 않은 경우 gzip만 사용
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_length = getattr(settings, "COMPRESSION_MIN_LENGTH", 1024)
+        self.stream_buffer = getattr(settings, "COMPRESSION_STREAM_BUFFER", 16384)
+        self.brotli_quality = getattr(settings, "COMPRESSION_BROTLI_QUALITY", 4)
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < self.min_length:
+            return response
+
+        if response.streaming and not response.is_async:
+            response.streaming_content = buffered(
+                response.streaming_content, self.stream_buffer
+            )
+
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if (
+            brotli is None
+            or not re_accepts_br.search(accept_encoding)
+            or response.has_header("Content-Encoding")
+            or (response.streaming and response.is_async)
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        if response.streaming:
+            response.streaming_content = self.brotli_sequence(
+                response.streaming_content
+            )
+            # 압축 후 크기는 전송이 끝나야 알 수 있음
+            del response.headers["Content-Length"]
+        else:
+            compressed_content = brotli.compress(
+                response.content, quality=self.brotli_quality
+            )
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+
+        # 압축된 응답의 ETag는 weak ETag로 변경 (GZipMiddleware와 동일)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+
+        return response
+
+    def brotli_sequence(self, chunks):
+        compressor = brotli.Compressor(quality=self.brotli_quality)
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
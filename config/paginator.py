@@ -0,0 +1,44 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimated_count(queryset):
+    """
+    PostgreSQL 통계(pg_class.reltuples)로 추정한 테이블 행 수
+    (PostgreSQL이 아니거나 아직 통계가 없으면 None)
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    # ANALYZE 전에는 -1 (PostgreSQL 14+) 또는 0
+    if row is None or row[0] <= 0:
+        return None
+    return row[0]
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    관리자 목록 페이지용 paginator
+
+    필터/검색이 없는 전체 목록은 COUNT(*) 대신 추정 행 수를 사용
+    (추정값이 threshold보다 작거나 추정할 수 없으면 COUNT(*))
+    """
+
+    threshold = 100000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is not None and not query.where:
+            estimate = estimated_count(self.object_list)
+            if estimate is not None and estimate >= self.threshold:
+                return estimate
+        return super().count
@@ -0,0 +1,111 @@
+import logging
+import re
+import time
+import traceback
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger("budgetplan.queries")
+
+# 값만 다른 같은 쿼리를 하나로 묶기 위한 치환 규칙
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*%s\s*,?)+\)", re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+
+# 측정 코드 자체의 프레임은 스택에서 제외
+_INSTRUMENTATION_FILES = {
+    __file__,
+    str(Path(__file__).with_name("middleware.py")),
+}
+
+
+def sql_template(sql):
+    """
+    파라미터, 문자열/숫자 값, IN (...) 목록 길이를 지운 쿼리 형태
+    """
+    sql = _STRING.sub("%s", sql)
+    sql = _NUMBER.sub("%s", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACES.sub(" ", sql).strip()
+
+
+def project_stack(limit=8):
+    """
+    현재 호출 스택 중 프로젝트 코드(설치된 패키지, 측정 코드 제외) 프레임만 반환
+    """
+    base_dir = str(settings.BASE_DIR)
+    frames = [
+        f"{Path(frame.filename).relative_to(base_dir)}:{frame.lineno} in {frame.name}"
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(base_dir)
+        and "site-packages" not in frame.filename
+        and frame.filename not in _INSTRUMENTATION_FILES
+    ]
+    return frames[-limit:]
+
+
+class QueryInspector:
+    """
+    한 요청에서 실행된 쿼리를 형태(template)별로 모아
+    N+1 패턴(같은 형태가 여러 번 반복)과 느린 쿼리를 기록
+    """
+
+    def __init__(self, n_plus_one_threshold, slow_query_ms):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.slow_query_seconds = slow_query_ms / 1000
+        self.templates = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.record(sql, params, duration)
+
+    def record(self, sql, params, duration):
+        template = sql_template(sql)
+        entry = self.templates.get(template)
+        if entry is None:
+            # 처음 실행된 위치를 N+1 원인으로 기록
+            entry = self.templates[template] = {
+                "count": 0,
+                "seconds": 0.0,
+                "stack": project_stack(),
+            }
+        entry["count"] += 1
+        entry["seconds"] += duration
+
+        if duration >= self.slow_query_seconds:
+            logger.warning(
+                "느린 쿼리 %.1fms: %s\nparams: %r\n%s",
+                duration * 1000,
+                sql,
+                params,
+                "\n".join(project_stack()),
+            )
+
+    def n_plus_one(self):
+        """
+        n_plus_one_threshold번 이상 반복된 쿼리 형태 (많이 반복된 순)
+        """
+        repeated = [
+            (template, entry)
+            for template, entry in self.templates.items()
+            if entry["count"] >= self.n_plus_one_threshold
+        ]
+        return sorted(repeated, key=lambda item: item[1]["count"], reverse=True)
+
+    def report(self, request):
+        for template, entry in self.n_plus_one():
+            logger.warning(
+                "N+1 의심 쿼리 %s %s: %d회 (%.1fms)\n%s\n%s",
+                request.method,
+                request.path,
+                entry["count"],
+                entry["seconds"] * 1000,
+                template,
+                "\n".join(entry["stack"]),
+            )
@@ -0,0 +1,58 @@
+import math
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 DRF 기본 JSONRenderer로 동작
+    orjson = None
+
+
+def _has_non_finite(value):
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson으로 JSON 응답을 만드는 renderer (DRF JSONRenderer와 같은 결과)
+
+    날짜/시간, 한글 등 비 ASCII 문자는 orjson이 직접 처리하고,
+    Decimal, lazy 문자열 등 orjson이 모르는 값은 DRF JSONEncoder로 변환
+    U+2028/U+2029는 DRF와 같이 escape
+    orjson이 설치되지 않았거나 indent를 요청한 경우, NaN/Infinity(strict 모드면 ValueError)나
+    64비트 범위를 넘는 정수처럼 orjson이 DRF와 다르게 처리하는 값은 DRF JSONRenderer를 사용
+    """
+
+    # DRF는 UTC 시간을 "Z"로 표기
+    options = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(
+            accepted_media_type or "", renderer_context or {}
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b""
+
+        try:
+            ret = orjson.dumps(data, default=JSONEncoder().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson은 NaN/Infinity를 null로 변환하므로 null이 있을 때만 확인하고
+        # DRF JSONRenderer로 처리 (strict 모드면 ValueError)
+        if b"null" in ret and _has_non_finite(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # JavaScript 문자열에서 줄바꿈으로 해석되는 문자 (DRF JSONRenderer와 동일)
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -0,0 +1,21 @@
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    단일 서버 운영용 SQLite backend
+
+    - journal_mode=WAL : 쓰기 중에도 다른 연결의 읽기를 막지 않음
+    - synchronous=NORMAL : WAL 모드에서 안전하면서 commit마다 fsync 하지 않음
+    - 트랜잭션을 BEGIN IMMEDIATE로 시작해, 읽기 잠금을 쓰기 잠금으로 올리다
+      "database is locked"로 바로 실패하지 않고 busy timeout(OPTIONS timeout)만큼 대기
+    """
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute("BEGIN IMMEDIATE")
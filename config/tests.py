@@ -0,0 +1,54 @@
+import datetime
+import decimal
+import uuid
+
+from django.test import SimpleTestCase
+from django.utils.functional import lazy
+
+from rest_framework.renderers import JSONRenderer
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """
+    ORJSONRenderer가 DRF JSONRenderer와 같은 JSON을 만드는지
+    """
+
+    def assertSameRender(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_same_as_drf(self):
+        self.assertSameRender(
+            {
+                "한글 키": "이번 달 사용 가능 한 금액",
+                "date": datetime.date(2024, 3, 5),
+                "datetime": datetime.datetime(
+                    2024, 3, 5, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc
+                ),
+                "naive": datetime.datetime(2024, 3, 5, 9, 30),
+                "time": datetime.time(9, 30, 15),
+                "decimal": decimal.Decimal("1.50"),
+                "uuid": uuid.UUID(int=5),
+                "lazy": lazy(lambda: "지연 문자열", str)(),
+                "none": None,
+                "list": [1, 2.5, (3, 4)],
+                1: "정수 키",
+            }
+        )
+
+    def test_line_separators_escaped(self):
+        data = {"pay_title": "줄\u2028바꿈\u2029문자"}
+        self.assertSameRender(data)
+        self.assertIn(b"\\u2028", ORJSONRenderer().render(data))
+
+    def test_non_finite_floats_rejected(self):
+        for value in (float("nan"), float("inf"), -float("inf")):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render({"value": value, "none": None})
+                with self.assertRaises(ValueError):
+                    ORJSONRenderer().render({"value": value, "none": None})
+
+    def test_big_integer(self):
+        self.assertSameRender({"total": 10**20})
@@ -1,9 +1,12 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from .metrics import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/users/", include("users.urls")),
     path("api/v1/payments/", include("payments.urls")),
     path("api/v1/plans/", include("plans.urls")),
+    path("metrics", metrics_view),
 ]
@@ -1,6 +1,8 @@
 from django.contrib import admin
 from .models import Payment
 
+from config.paginator import EstimatedCountPaginator
+
 
 @admin.register(Payment)
 class PaymentAdmin(admin.ModelAdmin):
@@ -13,3 +15,13 @@ class PaymentAdmin(admin.ModelAdmin):
         "pay_date",
     )
     list_display_links = ("pk", "owner")
+    list_select_related = ("owner",)
+    # date_hierarchy는 전체 테이블의 연도 목록(SELECT DISTINCT)을 조회하므로 사용하지 않고
+    # 날짜 필터(오늘, 최근 7일, 이번 달, 올해)만 제공
+    list_filter = ("pay_type", "pay_date")
+
+    # 전체 COUNT(*) 대신 추정 행 수, 필터 결과 페이지에서 전체 개수 조회 생략
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # 사용자 선택 목록을 전부 불러오지 않음
+    raw_id_fields = ("owner",)
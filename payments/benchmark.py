@@ -0,0 +1,87 @@
+import contextlib
+import os
+import re
+import statistics
+import tempfile
+import time
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import URLResolver, get_resolver
+
+
+@contextlib.contextmanager
+def benchmark_database(keepdb=False, threaded=False):
+    """
+    벤치마크용 테스트 DB를 만들고, 끝나면 삭제 (운영 DB는 건드리지 않음)
+
+    threaded=True 이면 여러 스레드가 같은 DB를 쓰도록 SQLite도 파일 DB 사용
+    """
+    if threaded and connection.vendor == "sqlite":
+        connection.settings_dict["TEST"]["NAME"] = os.path.join(
+            tempfile.mkdtemp(), "benchmark.sqlite3"
+        )
+
+    # DEBUG=True 이면 모든 쿼리를 기록하므로 운영 환경과 같이 끔
+    setup_test_environment(debug=False)
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+        teardown_test_environment()
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))
+    return values[index]
+
+
+def measure(func, repeat=20, warmup=2):
+    """
+    func를 repeat번 실행한 소요 시간 통계 (ms)
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+    }
+
+
+def iter_routes(patterns=None, prefix=""):
+    """
+    config/urls.py에 등록된 URL route를 "api/v1/payments/<str:owner>/" 형태로 반환
+
+    관리자 페이지(admin)는 제외
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace == "admin":
+                continue
+            yield from iter_routes(pattern.url_patterns, route)
+        else:
+            yield route
+
+
+def build_path(route, values):
+    """
+    route의 <converter:name> 부분을 values[name]으로 치환한 요청 경로
+    """
+    return "/" + re.sub(
+        r"<(?:\w+:)?(\w+)>", lambda match: str(values[match.group(1)]), route
+    )
@@ -0,0 +1,73 @@
+import csv
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from rest_framework.negotiation import BaseContentNegotiation
+
+from .utils import PAYMENT_FIELDS, payment_row
+
+EXPORT_FIELDS = ("pk", "owner") + PAYMENT_FIELDS[1:]
+
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson; charset=utf-8",
+}
+
+
+class ExportContentNegotiation(BaseContentNegotiation):
+    """
+    내보내기 파일 형식은 ?format= 으로 직접 선택하므로,
+    Accept 헤더나 format 값과 관계없이 첫 번째 renderer(JSON)를 사용 (에러 응답용)
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return (renderers[0], renderers[0].media_type)
+
+
+class Echo:
+    """
+    csv.writer가 쓴 한 줄을 그대로 반환하는 버퍼
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_payment_rows(payments, owner_name):
+    """
+    서버 측 cursor로 지출 내역을 chunk 단위로 읽어 한 행씩 반환
+    """
+    chunk_size = getattr(settings, "PAYMENT_EXPORT_CHUNK_SIZE", 2000)
+    rows = (
+        payments.order_by("pay_date", "pk")
+        .values(*PAYMENT_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    )
+    for row in rows:
+        yield payment_row(row, owner_name)
+
+
+def stream_csv(payments, owner_name):
+    # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+    yield "\ufeff"
+
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in iter_payment_rows(payments, owner_name):
+        yield writer.writerow([row[field] for field in EXPORT_FIELDS])
+
+
+def stream_ndjson(payments, owner_name):
+    for row in iter_payment_rows(payments, owner_name):
+        yield json.dumps(row, ensure_ascii=False, cls=DjangoJSONEncoder) + "\n"
+
+
+EXPORT_STREAMS = {
+    "csv": stream_csv,
+    "ndjson": stream_ndjson,
+}
@@ -0,0 +1,173 @@
+import json
+import subprocess
+import tracemalloc
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from payments.benchmark import (
+    benchmark_database,
+    build_path,
+    iter_routes,
+    measure,
+)
+from payments.models import Payment
+from payments.seeding import seed_user_payments
+from plans.models import MonthlyPlan
+from users.models import User
+
+# route별로 추가로 측정할 query string
+ROUTE_VARIANTS = {
+    "api/v1/payments/<str:owner>/<int:year>-<int:month>/": ["", "?page_size=50"],
+    "api/v1/payments/<str:owner>/trend/": ["", "?by_type=true"],
+    "api/v1/payments/<str:owner>/export/": ["?format=csv", "?format=ndjson"],
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "지출 내역 수별로 전체 API(GET)의 응답 시간(p50/p95), 쿼리 수, 최대 메모리를 "
+        "측정해 JSON 보고서로 저장합니다. (테스트 DB 사용)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--payments",
+            type=int,
+            nargs="+",
+            default=[1000, 10000],
+            help="측정할 사용자별 지출 내역 수 (예: 1000 100000 1000000)",
+        )
+        parser.add_argument("--days", type=int, default=365, help="지출 내역 기간(일)")
+        parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="요청마다 캐시를 비워 캐시되지 않은 응답 시간을 측정",
+        )
+        parser.add_argument(
+            "--output", default="bench_api.json", help="JSON 보고서 저장 경로"
+        )
+        parser.add_argument("--compare", help="비교할 이전 JSON 보고서 경로")
+
+    def handle(self, *args, **options):
+        report = {
+            "commit": git_commit(),
+            "database": connection.vendor,
+            "repeat": options["repeat"],
+            "no_cache": options["no_cache"],
+            "results": {},
+        }
+
+        with benchmark_database():
+            for index, size in enumerate(options["payments"]):
+                self.stdout.write(f"지출 내역 {size}건 측정 중...")
+                report["results"][str(size)] = self.run_volume(index, size, options)
+
+        with open(options["output"], "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2, sort_keys=True)
+            file.write("\n")
+        self.stdout.write(self.style.SUCCESS(f"{options['output']} 저장 완료"))
+
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as file:
+                self.compare(json.load(file), report)
+
+    def run_volume(self, index, size, options):
+        today = timezone.localtime().date()
+        # 관리자 전용 API도 측정하기 위해 staff 사용자로 요청
+        user = User.objects.create_user(
+            f"bench_api_{index}",
+            "bench_password",
+            name=f"bench {index}",
+            is_staff=True,
+        )
+        MonthlyPlan.objects.create(
+            owner=user,
+            monthly_income=3000000,
+            monthly_saving=1000000,
+            monthly_possible=2000000,
+        )
+        seed_user_payments([user], [index], size, today, days=options["days"])
+
+        values = {
+            "owner": user.username,
+            "year": today.year,
+            "month": today.month,
+            "day": today.day,
+            "pk": Payment.objects.filter(owner=user).values_list("pk", flat=True)[0],
+        }
+
+        client = APIClient()
+        client.force_authenticate(user)
+        # async view(DRF가 아닌 view)는 세션으로 인증
+        client.force_login(user)
+        cache = caches["default"]
+
+        results = {}
+        for route in iter_routes():
+            for query in ROUTE_VARIANTS.get(route, [""]):
+                path = build_path(route, values) + query
+
+                def request():
+                    if options["no_cache"]:
+                        cache.clear()
+                    response = client.get(path)
+                    if response.streaming:
+                        size_bytes = sum(len(chunk) for chunk in response.streaming_content)
+                        return response, size_bytes
+                    return response, len(response.content)
+
+                with CaptureQueriesContext(connection) as queries:
+                    response, size_bytes = request()
+                # 이후 요청 시작 시 쿼리 기록이 초기화되므로 바로 계산
+                query_count = len(queries)
+
+                tracemalloc.start()
+                request()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                results[f"GET /{route}{query}"] = {
+                    "status": response.status_code,
+                    "bytes": size_bytes,
+                    "queries": query_count,
+                    "peak_kb": round(peak / 1024, 1),
+                    **measure(request, repeat=options["repeat"]),
+                }
+        return results
+
+    def compare(self, old, new):
+        self.stdout.write(f"\n{old.get('commit')} -> {new.get('commit')}")
+        for size, results in new["results"].items():
+            old_results = old["results"].get(size, {})
+            for name, result in results.items():
+                before = old_results.get(name)
+                if before is None:
+                    continue
+                change = (
+                    (result["p50_ms"] - before["p50_ms"]) / before["p50_ms"] * 100
+                    if before["p50_ms"]
+                    else 0
+                )
+                self.stdout.write(
+                    f"[{size}] {name}: p50 {before['p50_ms']} -> {result['p50_ms']}ms "
+                    f"({change:+.1f}%), queries {before['queries']} -> {result['queries']}"
+                )
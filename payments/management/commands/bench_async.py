@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient
+from django.utils import timezone
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from payments.benchmark import benchmark_database, percentile
+from payments.seeding import seed_user_payments
+from plans.models import MonthlyPlan
+from users.models import User
+
+# (이름, sync view 경로, async view 경로)
+ENDPOINTS = (
+    (
+        "monthly plan",
+        "/api/v1/plans/monthly/{owner}/",
+        "/api/v1/plans/monthly/{owner}/async/",
+    ),
+    (
+        "today plan",
+        "/api/v1/plans/{owner}/{today:%Y-%m-%d}/",
+        "/api/v1/plans/{owner}/{today:%Y-%m-%d}/async/",
+    ),
+    (
+        "monthly payments",
+        "/api/v1/payments/{owner}/{today:%Y-%m}/",
+        "/api/v1/payments/{owner}/{today:%Y-%m}/async/",
+    ),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "ASGI 핸들러로 동시 요청을 보내 조회 API의 sync view와 async view "
+        "처리량(req/s)과 응답 시간을 비교합니다. (테스트 DB 사용)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 10, 50],
+            help="동시 요청 수",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=200, help="측정별 전체 요청 수"
+        )
+        parser.add_argument(
+            "--payments", type=int, default=1000, help="사용자의 지출 내역 수"
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="요청마다 캐시를 비워 캐시되지 않은 응답 시간을 측정",
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localtime().date()
+
+        with benchmark_database(threaded=True):
+            user = User.objects.create_user("bench_async", name="bench")
+            MonthlyPlan.objects.create(
+                owner=user,
+                monthly_income=3000000,
+                monthly_saving=1000000,
+                monthly_possible=2000000,
+            )
+            seed_user_payments([user], [0], options["payments"], today, days=60)
+            token = str(RefreshToken.for_user(user).access_token)
+
+            self.stdout.write(
+                f"{'endpoint':<18} {'view':<6} {'conc':>5} {'req/s':>9} "
+                f"{'p50(ms)':>9} {'p95(ms)':>9}"
+            )
+            for name, sync_path, async_path in ENDPOINTS:
+                for concurrency in options["concurrency"]:
+                    for view, path in (("sync", sync_path), ("async", async_path)):
+                        path = path.format(owner=user.username, today=today)
+                        requests_per_sec, timings = async_to_sync(self.run_load)(
+                            path,
+                            token,
+                            concurrency,
+                            options["requests"],
+                            options["no_cache"],
+                        )
+                        self.stdout.write(
+                            f"{name:<18} {view:<6} {concurrency:>5} "
+                            f"{requests_per_sec:>9.1f} "
+                            f"{percentile(timings, 50):>9.2f} "
+                            f"{percentile(timings, 95):>9.2f}"
+                        )
+
+    async def run_load(self, path, token, concurrency, total_requests, no_cache):
+        client = AsyncClient()
+        headers = {"Authorization": f"Bearer {token}"}
+        cache = caches["default"]
+        timings = []
+        counter = iter(range(total_requests))
+
+        async def worker():
+            for _ in counter:
+                if no_cache:
+                    await cache.aclear()
+                started = time.perf_counter()
+                response = await client.get(path, headers=headers)
+                timings.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    raise CommandError(f"{path}: {response.status_code}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        return total_requests / elapsed, timings
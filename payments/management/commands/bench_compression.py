@@ -0,0 +1,69 @@
+import random
+
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils import timezone
+
+from config.middleware import CompressionMiddleware, brotli
+from config.renderers import ORJSONRenderer
+from payments.benchmark import measure
+from payments.seeding import PAYMENT_COLUMNS, generate_payments
+
+
+class Command(BaseCommand):
+    help = (
+        "한 달 지출 내역 응답 크기별로 gzip / brotli 압축 후 크기와 "
+        "압축에 드는 시간을 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[10, 100, 1000, 10000],
+            help="응답에 포함할 지출 내역 수",
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+
+    def handle(self, *args, **options):
+        encodings = ["gzip", "br"] if brotli else ["gzip"]
+        factory = RequestFactory()
+        today = timezone.localtime().date()
+
+        self.stdout.write(
+            f"{'rows':>7} {'bytes':>10} {'encoding':>8} {'on wire':>10} "
+            f"{'ratio':>7} {'p50(ms)':>9} {'MB/s':>8}"
+        )
+        for size in options["rows"]:
+            payments = [
+                dict(zip(PAYMENT_COLUMNS, row), pk=index, owner="사용자")
+                for index, row in enumerate(
+                    generate_payments(1, size, today, 30, random.Random(size))
+                )
+            ]
+            content = ORJSONRenderer().render(
+                {"이번 달 총 지출 금액": 0, "지출 내역": payments}
+            )
+
+            for encoding in encodings:
+                request = factory.get("/", HTTP_ACCEPT_ENCODING=encoding)
+                middleware = CompressionMiddleware(
+                    lambda request: HttpResponse(
+                        content, content_type="application/json"
+                    )
+                )
+
+                response = middleware(request)
+                on_wire = len(response.content)
+                result = measure(
+                    lambda: middleware(request), repeat=options["repeat"]
+                )
+                self.stdout.write(
+                    f"{size:>7} {len(content):>10} "
+                    f"{response.get('Content-Encoding', 'none'):>8} "
+                    f"{on_wire:>10} {on_wire / len(content):>7.2f} "
+                    f"{result['p50_ms']:>9} "
+                    f"{len(content) / result['p50_ms'] / 1000:>8.1f}"
+                )
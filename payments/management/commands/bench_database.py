@@ -0,0 +1,121 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from payments.benchmark import benchmark_database, percentile
+from plans.models import MonthlyPlan
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "동시 사용자 수별로 지출 입력(POST)과 월별 조회(GET)를 섞어 실행해 "
+        "DATABASE_URL로 설정된 DB의 처리량과 응답 시간을 측정합니다. (테스트 DB 사용)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads",
+            type=int,
+            nargs="+",
+            default=[1, 4, 16],
+            help="동시 사용자(스레드) 수",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=100, help="사용자별 요청 수"
+        )
+        parser.add_argument(
+            "--write-ratio",
+            type=float,
+            default=0.5,
+            help="전체 요청 중 지출 입력(POST) 비율 (0~1)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{connection.settings_dict['ENGINE']} "
+            f"(CONN_MAX_AGE={connection.settings_dict['CONN_MAX_AGE']})"
+        )
+        with benchmark_database(threaded=True):
+            self.stdout.write(
+                f"{'threads':>7} {'req/s':>9} {'p50(ms)':>9} {'p95(ms)':>9} "
+                f"{'errors':>7}"
+            )
+            for threads in options["threads"]:
+                self.run_threads(threads, options)
+
+    def run_threads(self, threads, options):
+        users = []
+        for index in range(threads):
+            user = User.objects.create_user(
+                f"bench_db_{threads}_{index}", name=f"bench {index}"
+            )
+            MonthlyPlan.objects.create(
+                owner=user,
+                monthly_income=3000000,
+                monthly_saving=1000000,
+                monthly_possible=2000000,
+            )
+            users.append(user)
+
+        today = timezone.localtime().date()
+        writes_every = (
+            round(1 / options["write_ratio"]) if options["write_ratio"] > 0 else 0
+        )
+        timings = []
+        errors = []
+        lock = threading.Lock()
+        start = threading.Barrier(threads)
+
+        def worker(user):
+            client = APIClient()
+            client.force_authenticate(user)
+            monthly_url = f"/api/v1/payments/{user.username}/{today:%Y-%m}/"
+            local_timings = []
+            local_errors = 0
+            start.wait()
+            try:
+                for index in range(options["requests"]):
+                    started = time.perf_counter()
+                    if writes_every and index % writes_every == 0:
+                        response = client.post(
+                            "/api/v1/payments/new/",
+                            {
+                                "pay_type": "Food",
+                                "pay_title": f"점심 {index}",
+                                "pay_price": 9000,
+                            },
+                            format="json",
+                        )
+                    else:
+                        response = client.get(monthly_url)
+                    local_timings.append((time.perf_counter() - started) * 1000)
+                    if response.status_code >= 400:
+                        local_errors += 1
+            except Exception:
+                local_errors += 1
+            finally:
+                # 스레드별 DB 연결 정리
+                connections.close_all()
+            with lock:
+                timings.extend(local_timings)
+                errors.append(local_errors)
+
+        workers = [threading.Thread(target=worker, args=(user,)) for user in users]
+        started = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{threads:>7} {len(timings) / elapsed:>9.1f} "
+            f"{percentile(timings, 50):>9.2f} {percentile(timings, 95):>9.2f} "
+            f"{sum(errors):>7}"
+        )
@@ -0,0 +1,124 @@
+import datetime
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from plans.analytics import PAY_TYPES, SHARE_LOOKBACK_DAYS, budget_curves
+from plans.budget import today_possible
+
+
+def python_curves(spending, start_date, monthly_possible):
+    """
+    budget_curves와 같은 계산을 사용자 한 명씩 Python 반복문으로 (비교용)
+    """
+    today = []
+    allocation = []
+    present_payments = 0
+    window = [0] * len(PAY_TYPES)
+    for offset, day_spending in enumerate(spending):
+        on_date = start_date + datetime.timedelta(days=offset)
+        if on_date.day == 1:
+            present_payments = 0
+        present_payments += sum(day_spending)
+        for code, price in enumerate(day_spending):
+            window[code] += price
+        if offset >= SHARE_LOOKBACK_DAYS:
+            for code, price in enumerate(spending[offset - SHARE_LOOKBACK_DAYS]):
+                window[code] -= price
+
+        possible = today_possible(monthly_possible, present_payments, on_date)
+        window_total = sum(window)
+        today.append(possible)
+        allocation.append(
+            [
+                round(
+                    possible
+                    * (price / window_total if window_total else 1 / len(window))
+                    / 100
+                )
+                * 100
+                for price in window
+            ]
+        )
+    return today, allocation
+
+
+class Command(BaseCommand):
+    help = (
+        "사용자별 1년치 일별 지출로 누적 지출, 예상 월말 지출, 하루 평균 지출, "
+        "지출 종류별 하루 사용 가능 금액을 계산하는 시간을 "
+        "numpy(budget_curves)와 Python 반복문으로 비교합니다. (DB 사용 안 함)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10000, help="사용자 수")
+        parser.add_argument("--days", type=int, default=365, help="일별 데이터 기간")
+        parser.add_argument(
+            "--chunk", type=int, default=500, help="한 번에 계산할 사용자 수"
+        )
+        parser.add_argument(
+            "--sample",
+            type=int,
+            default=50,
+            help="Python 반복문으로 계산할 사용자 수 (결과 비교, 속도 추정)",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        users = options["users"]
+        days = options["days"]
+        chunk = options["chunk"]
+        rng = np.random.default_rng(options["seed"])
+        start_date = datetime.date(timezone.localtime().year - 1, 1, 1)
+
+        def synthetic(size):
+            # 하루에 지출 종류마다 10% 확률로 1,000 ~ 30,000원 지출
+            shape = (size, days, len(PAY_TYPES))
+            prices = rng.integers(10, 300, size=shape) * 100
+            spending = np.where(rng.random(shape) < 0.1, prices, 0)
+            monthly_possible = rng.integers(30, 200, size=size) * 10000
+            return spending, monthly_possible
+
+        vectorized_seconds = 0.0
+        for offset in range(0, users, chunk):
+            spending, monthly_possible = synthetic(min(chunk, users - offset))
+            started = time.perf_counter()
+            budget_curves(spending, start_date, monthly_possible)
+            vectorized_seconds += time.perf_counter() - started
+
+        sample = min(options["sample"], users)
+        spending, monthly_possible = synthetic(sample)
+        curves = budget_curves(spending, start_date, monthly_possible)
+        python_seconds = 0.0
+        for index in range(sample):
+            rows = spending[index].tolist()
+            started = time.perf_counter()
+            today, allocation = python_curves(
+                rows, start_date, int(monthly_possible[index])
+            )
+            python_seconds += time.perf_counter() - started
+            if (
+                today != curves["today_possible"][index].tolist()
+                or allocation != curves["allocation"][index].tolist()
+            ):
+                raise CommandError("numpy 결과가 Python 반복문 결과와 다릅니다.")
+
+        self.stdout.write(f"{users} users x {days} days x {len(PAY_TYPES)} pay types")
+        self.stdout.write(
+            f"{'path':<10} {'users':>8} {'seconds':>10} {'users/sec':>12}"
+        )
+        python_rate = sample / python_seconds
+        vectorized_rate = users / vectorized_seconds
+        self.stdout.write(
+            f"{'python':<10} {sample:>8} {python_seconds:>10.3f} {python_rate:>12.0f}"
+        )
+        self.stdout.write(
+            f"{'numpy':<10} {users:>8} {vectorized_seconds:>10.3f} "
+            f"{vectorized_rate:>12.0f}"
+        )
+        self.stdout.write(
+            f"Python 반복문으로 {users}명 예상: {users / python_rate:.1f}s "
+            f"(numpy {vectorized_rate / python_rate:.0f}배)"
+        )
@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from rest_framework.renderers import JSONRenderer
+
+from payments.benchmark import benchmark_database, measure
+from payments.models import Payment
+from payments.seeding import seed_user_payments
+from payments.serializers import PaymentSerializer
+from payments.utils import PAYMENT_FIELDS, payment_row, payments_with_total
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "PaymentSerializer(many=True)와 values() 기반 변환(payment_row)의 "
+        "초당 처리 행 수를 비교합니다. (테스트 DB 사용)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[1000, 10000],
+            help="측정할 지출 내역 수",
+        )
+        parser.add_argument("--repeat", type=int, default=10, help="측정 반복 횟수")
+
+    def handle(self, *args, **options):
+        renderer = JSONRenderer()
+        today = timezone.localtime().date()
+
+        with benchmark_database():
+            self.stdout.write(
+                f"{'rows':>8} {'path':<22} {'p50(ms)':>10} {'rows/sec':>12}"
+            )
+            for index, size in enumerate(options["rows"]):
+                user = User.objects.create_user(
+                    f"bench_serializer_{index}", name=f"bench {index}"
+                )
+                seed_user_payments([user], [index], size, today, days=365)
+                payments = Payment.objects.filter(owner=user).order_by(
+                    "pay_date", "pk"
+                )
+
+                instances = list(payments.select_related("owner"))
+                rows = list(payments.values(*PAYMENT_FIELDS))
+                cases = {
+                    # 변환만 (DB 조회 제외)
+                    "serializer": lambda: PaymentSerializer(
+                        instances, many=True
+                    ).data,
+                    "payment_row": lambda: [
+                        payment_row(row, user.name) for row in rows
+                    ],
+                    # DB 조회 + 변환 + JSON 렌더링
+                    "serializer+query": lambda: renderer.render(
+                        PaymentSerializer(
+                            payments.select_related("owner"), many=True
+                        ).data
+                    ),
+                    "payment_row+query": lambda: renderer.render(
+                        payments_with_total(payments, user.name)[1]
+                    ),
+                }
+
+                expected = renderer.render(cases["serializer"]())
+                if renderer.render(cases["payment_row"]()) != expected:
+                    raise CommandError("payment_row 결과가 PaymentSerializer와 다릅니다.")
+
+                for name, func in cases.items():
+                    result = measure(func, repeat=options["repeat"])
+                    rows_per_sec = round(size / result["p50_ms"] * 1000)
+                    self.stdout.write(
+                        f"{size:>8} {name:<22} {result['p50_ms']:>10} "
+                        f"{rows_per_sec:>12}"
+                    )
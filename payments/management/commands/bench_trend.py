@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from payments.benchmark import benchmark_database, measure
+from payments.seeding import seed_user_payments
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "지출 내역 수에 따른 월별 지출 추이 API 응답 시간을 측정합니다. (테스트 DB 사용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1000, 10000, 100000],
+            help="측정할 사용자별 지출 내역 수",
+        )
+        parser.add_argument("--years", type=int, default=5, help="지출 내역 기간(년)")
+        parser.add_argument("--repeat", type=int, default=50, help="측정 반복 횟수")
+
+    def handle(self, *args, **options):
+        today = timezone.localtime().date()
+        url = "/api/v1/payments/{}/trend/?start={:%Y-%m}&end={:%Y-%m}&by_type=true"
+
+        with benchmark_database():
+            self.stdout.write(f"{'payments':>10} {'p50(ms)':>10} {'p95(ms)':>10}")
+            for index, size in enumerate(options["sizes"]):
+                user = User.objects.create_user(
+                    f"bench_trend_{index}", name=f"bench {index}"
+                )
+                seed_user_payments(
+                    [user], [index], size, today, days=365 * options["years"]
+                )
+
+                client = APIClient()
+                client.force_authenticate(user)
+                trend_url = url.format(
+                    user.username, today.replace(year=today.year - 1), today
+                )
+                # ETag 캐시가 아닌 실제 계산 시간을 측정
+                result = measure(
+                    lambda: client.get(trend_url), repeat=options["repeat"]
+                )
+                self.stdout.write(
+                    f"{size:>10} {result['p50_ms']:>10} {result['p95_ms']:>10}"
+                )
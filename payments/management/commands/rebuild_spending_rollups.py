@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from payments.rollups import rebuild_rollups
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "지출 내역으로부터 일별/월별 지출 집계 테이블을 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "usernames",
+            nargs="*",
+            help="집계를 다시 생성할 사용자 (생략하면 전체 사용자)",
+        )
+
+    def handle(self, *args, **options):
+        owners = None
+        if options["usernames"]:
+            owners = list(User.objects.filter(username__in=options["usernames"]))
+            missing = set(options["usernames"]) - {user.username for user in owners}
+            if missing:
+                raise CommandError(f"존재하지 않는 사용자입니다: {', '.join(sorted(missing))}")
+
+        rebuild_rollups(owners)
+        self.stdout.write(self.style.SUCCESS("지출 집계가 다시 생성되었습니다."))
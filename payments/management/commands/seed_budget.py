@@ -0,0 +1,123 @@
+import datetime
+import multiprocessing
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.utils import timezone
+
+from payments.rollups import rebuild_rollups
+from payments.seeding import DISTRIBUTIONS, create_users, seed_user_payments
+from users.models import User
+
+
+def _seed_chunk(job):
+    """
+    하위 프로세스에서 사용자 묶음의 지출 내역 저장 (지출 집계는 마지막에 한 번 생성)
+    """
+    user_pks, indexes, options = job
+    return seed_user_payments(
+        [User(pk=pk) for pk in user_pks],
+        indexes,
+        options["payments"],
+        options["end_date"],
+        options["days"],
+        seed=options["seed"],
+        distribution=options["distribution"],
+        batch_size=options["batch_size"],
+        rollups=False,
+    )
+
+
+def _seed_chunk_in_process(job):
+    try:
+        return _seed_chunk(job)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        "부하 테스트용 사용자, 한 달 예산 계획, 지출 내역을 생성합니다. "
+        "(같은 --seed 면 프로세스 수와 관계없이 같은 데이터 생성)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100, help="생성할 사용자 수")
+        parser.add_argument(
+            "--payments", type=int, default=1000, help="사용자별 지출 내역 수"
+        )
+        parser.add_argument("--days", type=int, default=365, help="지출 내역 기간(일)")
+        parser.add_argument(
+            "--end-date",
+            type=datetime.date.fromisoformat,
+            help="지출 내역 마지막 날짜 (yyyy-mm-dd, 기본 오늘)",
+        )
+        parser.add_argument(
+            "--distribution",
+            choices=DISTRIBUTIONS,
+            default="uniform",
+            help="지출 날짜 분포",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed")
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="INSERT 한 번에 저장할 행 수"
+        )
+        parser.add_argument(
+            "--processes", type=int, default=1, help="지출 내역을 저장할 프로세스 수"
+        )
+        parser.add_argument(
+            "--prefix", default="seed_", help="생성할 사용자 username 접두사"
+        )
+        parser.add_argument(
+            "--no-rollups", action="store_true", help="지출 집계 테이블을 생성하지 않음"
+        )
+
+    def handle(self, *args, **options):
+        options["end_date"] = options["end_date"] or timezone.localtime().date()
+
+        start_index = User.objects.filter(
+            username__startswith=options["prefix"]
+        ).count()
+        indexes = list(range(start_index, start_index + options["users"]))
+        if not indexes:
+            raise CommandError("--users는 1 이상이어야 합니다.")
+
+        processes = options["processes"]
+        if processes > 1 and connection.vendor == "sqlite":
+            self.stderr.write("SQLite는 동시에 쓸 수 없으므로 1개 프로세스로 실행합니다.")
+            processes = 1
+
+        started = time.perf_counter()
+        users = create_users(options["prefix"], indexes, options["seed"])
+        self.stdout.write(f"사용자/예산 계획 {len(users)}건 생성")
+
+        if processes > 1:
+            chunk = -(-len(users) // processes)
+            jobs = [
+                (
+                    [user.pk for user in users[offset : offset + chunk]],
+                    indexes[offset : offset + chunk],
+                    options,
+                )
+                for offset in range(0, len(users), chunk)
+            ]
+            # 하위 프로세스가 부모의 DB 연결을 공유하지 않도록 닫음
+            connections.close_all()
+            with multiprocessing.get_context("fork").Pool(processes) as pool:
+                total = sum(pool.map(_seed_chunk_in_process, jobs))
+        else:
+            total = _seed_chunk(([user.pk for user in users], indexes, options))
+        self.stdout.write(f"지출 내역 {total}건 생성")
+
+        if not options["no_rollups"]:
+            for offset in range(0, len(users), 500):
+                rebuild_rollups(users[offset : offset + 500])
+            self.stdout.write("지출 집계 생성")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"완료: {elapsed:.1f}초 ({total / elapsed:,.0f} 지출 내역/초)"
+            )
+        )
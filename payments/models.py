@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from users.models import User
@@ -28,6 +28,8 @@ class Payment(models.Model):
         related_name="payments",
         on_delete=models.CASCADE,
         blank=False,
+        # (owner, pay_date) 복합 인덱스가 owner 단독 조회도 처리
+        db_index=False,
     )
 
     # 지출 종류
@@ -61,5 +63,116 @@ class Payment(models.Model):
         null=True,
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["owner", "pay_date"],
+                name="payment_owner_date_idx",
+            ),
+            models.Index(
+                fields=["owner", "pay_type", "pay_date"],
+                name="payment_owner_type_date_idx",
+            ),
+            # 관리자 목록의 날짜/지출 종류 필터 (전체 사용자 대상)
+            models.Index(
+                fields=["pay_date"],
+                name="payment_date_idx",
+            ),
+            models.Index(
+                fields=["pay_type", "pay_date"],
+                name="payment_type_date_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.pay_title} - {self.pay_price}원"
+
+    def save(self, *args, **kwargs):
+        # 수정 전 값 조회(잠금)와 집계 테이블 갱신(payments.signals)을
+        # 저장과 같은 트랜잭션에서 실행
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+
+
+class DailySpending(models.Model):
+    """
+    하루 지출 집계 모델 (사용자, 날짜, 지출 종류별)
+    """
+
+    owner = models.ForeignKey(
+        User,
+        related_name="daily_spendings",
+        on_delete=models.CASCADE,
+    )
+
+    # 지출 날짜
+    date = models.DateField()
+
+    # 지출 종류
+    pay_type = models.CharField(
+        max_length=15,
+        choices=Payment.PayChoices.choices,
+    )
+
+    # 총 지출 금액
+    total_price = models.PositiveBigIntegerField(
+        default=0,
+    )
+
+    # 지출 건수
+    count = models.PositiveIntegerField(
+        default=0,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "date", "pay_type"],
+                name="unique_daily_spending",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.pay_type} - {self.total_price}원"
+
+
+class MonthlySpending(models.Model):
+    """
+    한 달 지출 집계 모델 (사용자, 월, 지출 종류별)
+    """
+
+    owner = models.ForeignKey(
+        User,
+        related_name="monthly_spendings",
+        on_delete=models.CASCADE,
+    )
+
+    # 해당 월의 1일
+    month = models.DateField()
+
+    # 지출 종류
+    pay_type = models.CharField(
+        max_length=15,
+        choices=Payment.PayChoices.choices,
+    )
+
+    # 총 지출 금액
+    total_price = models.PositiveBigIntegerField(
+        default=0,
+    )
+
+    # 지출 건수
+    count = models.PositiveIntegerField(
+        default=0,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "month", "pay_type"],
+                name="unique_monthly_spending",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.pay_type} - {self.total_price}원"
@@ -0,0 +1,102 @@
+import base64
+import binascii
+import datetime
+
+from django.conf import settings
+from django.db.models import Q
+
+from rest_framework.exceptions import ParseError
+from rest_framework.utils.urls import replace_query_param
+
+from .utils import PAYMENT_FIELDS, payment_row
+
+
+class PaymentCursorPagination:
+    """
+    (pay_date, pk) 순서의 키셋(cursor) 페이지네이션
+
+    OFFSET 없이 마지막으로 본 (pay_date, pk) 다음 행부터 조회하므로
+    지출 내역이 많아도 페이지마다 일정한 시간에 조회
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+
+    def __init__(self):
+        self.page_size = getattr(settings, "PAYMENT_PAGE_SIZE", 50)
+        self.max_page_size = getattr(settings, "PAYMENT_MAX_PAGE_SIZE", 500)
+
+    def is_requested(self, request):
+        params = request.query_params
+        return (
+            self.cursor_query_param in params or self.page_size_query_param in params
+        )
+
+    def get_page_size(self, request):
+        page_size = request.query_params.get(self.page_size_query_param)
+        if page_size is None:
+            return self.page_size
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            raise ParseError("page_size는 숫자여야 합니다.")
+        if page_size < 1:
+            raise ParseError("page_size는 1 이상이어야 합니다.")
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, pay_date, pk):
+        position = f"{pay_date.isoformat()}:{pk}".encode()
+        return base64.urlsafe_b64encode(position).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            pay_date, pk = base64.urlsafe_b64decode(padded).decode().split(":")
+            return datetime.date.fromisoformat(pay_date), int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ParseError("잘못된 cursor 입니다.")
+
+    def get_page_queryset(self, payments, request):
+        """
+        cursor 다음의 한 페이지 + 1행을 조회하는 queryset과 page_size 반환
+        """
+        page_size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            pay_date, pk = self.decode_cursor(cursor)
+            payments = payments.filter(
+                Q(pay_date__gt=pay_date) | Q(pay_date=pay_date, pk__gt=pk)
+            )
+
+        # 다음 페이지 존재 여부를 알기 위해 한 행 더 조회
+        rows = payments.order_by("pay_date", "pk").values(*PAYMENT_FIELDS)
+        return rows[: page_size + 1], page_size
+
+    def get_page(self, rows, page_size, request, owner_name):
+        next_url = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            next_url = replace_query_param(
+                request.build_absolute_uri(),
+                self.cursor_query_param,
+                self.encode_cursor(last["pay_date"], last["pk"]),
+            )
+
+        return [payment_row(row, owner_name) for row in rows], next_url
+
+    def paginate(self, payments, request, owner_name):
+        """
+        한 페이지의 지출 내역과 다음 페이지 URL 반환
+        """
+        rows, page_size = self.get_page_queryset(payments, request)
+        return self.get_page(list(rows), page_size, request, owner_name)
+
+    async def apaginate(self, payments, request, owner_name):
+        """
+        paginate의 async 버전
+        """
+        rows, page_size = self.get_page_queryset(payments, request)
+        rows = [row async for row in rows]
+        return self.get_page(rows, page_size, request, owner_name)
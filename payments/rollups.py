@@ -0,0 +1,149 @@
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+
+from .models import DailySpending, MonthlySpending, Payment
+
+
+def _add(model, key_field, owner_id, key, pay_type, price, count):
+    """
+    집계 행에 금액/건수를 더함 (행이 없으면 생성)
+    """
+    lookup = {"owner_id": owner_id, key_field: key, "pay_type": pay_type}
+    updated = model.objects.filter(**lookup).update(
+        total_price=F("total_price") + price,
+        count=F("count") + count,
+    )
+    if updated:
+        return
+
+    try:
+        with transaction.atomic():
+            model.objects.create(total_price=price, count=count, **lookup)
+    except IntegrityError:
+        # 동시에 같은 행이 생성된 경우 다시 더함
+        model.objects.filter(**lookup).update(
+            total_price=F("total_price") + price,
+            count=F("count") + count,
+        )
+
+
+def _apply(signed_payments):
+    daily = defaultdict(lambda: [0, 0])
+    for payment, sign in signed_payments:
+        if payment.pay_date is None:
+            continue
+        key = (payment.owner_id, payment.pay_date, payment.pay_type)
+        daily[key][0] += payment.pay_price * sign
+        daily[key][1] += sign
+
+    monthly = defaultdict(lambda: [0, 0])
+    for (owner_id, pay_date, pay_type), (price, count) in daily.items():
+        key = (owner_id, pay_date.replace(day=1), pay_type)
+        monthly[key][0] += price
+        monthly[key][1] += count
+
+    with transaction.atomic():
+        for model, key_field, deltas in (
+            (DailySpending, "date", daily),
+            (MonthlySpending, "month", monthly),
+        ):
+            for (owner_id, key, pay_type), (price, count) in deltas.items():
+                if price or count:
+                    _add(model, key_field, owner_id, key, pay_type, price, count)
+
+
+def apply_payments(payments, sign=1):
+    """
+    지출 내역 목록을 집계 테이블에 반영 (sign=-1 이면 차감)
+    """
+    _apply((payment, sign) for payment in payments)
+
+
+def payment_added(payment):
+    apply_payments([payment])
+
+
+def payment_removed(payment):
+    apply_payments([payment], sign=-1)
+
+
+def payment_changed(previous, payment):
+    """
+    수정 전(previous)과 수정 후(payment)의 차이만 집계 테이블에 반영
+    (날짜, 지출 종류, 금액이 그대로면 쿼리 없음)
+    """
+    _apply(((previous, -1), (payment, 1)))
+
+
+def _month_spendings(owner, on_date):
+    return MonthlySpending.objects.filter(owner=owner, month=on_date.replace(day=1))
+
+
+def month_total(owner, on_date):
+    """
+    해당 월의 총 지출 금액
+    """
+    result = _month_spendings(owner, on_date).aggregate(total=Sum("total_price"))
+    return result["total"] or 0
+
+
+async def amonth_total(owner, on_date):
+    """
+    month_total의 async 버전
+    """
+    result = await _month_spendings(owner, on_date).aaggregate(
+        total=Sum("total_price")
+    )
+    return result["total"] or 0
+
+
+def rebuild_rollups(owners=None):
+    """
+    지출 내역에서 집계 테이블을 다시 생성
+    """
+    payments = Payment.objects.filter(pay_date__isnull=False)
+    daily = DailySpending.objects.all()
+    monthly = MonthlySpending.objects.all()
+    if owners is not None:
+        payments = payments.filter(owner__in=owners)
+        daily = daily.filter(owner__in=owners)
+        monthly = monthly.filter(owner__in=owners)
+
+    with transaction.atomic():
+        daily.delete()
+        monthly.delete()
+
+        DailySpending.objects.bulk_create(
+            (
+                DailySpending(
+                    owner_id=row["owner"],
+                    date=row["pay_date"],
+                    pay_type=row["pay_type"],
+                    total_price=row["total_price"],
+                    count=row["count"],
+                )
+                for row in payments.values("owner", "pay_date", "pay_type")
+                .annotate(total_price=Sum("pay_price"), count=Count("pk"))
+                .order_by()
+            ),
+            batch_size=1000,
+        )
+        MonthlySpending.objects.bulk_create(
+            (
+                MonthlySpending(
+                    owner_id=row["owner"],
+                    month=row["month"],
+                    pay_type=row["pay_type"],
+                    total_price=row["total_price"],
+                    count=row["count"],
+                )
+                for row in payments.annotate(month=TruncMonth("pay_date"))
+                .values("owner", "month", "pay_type")
+                .annotate(total_price=Sum("pay_price"), count=Count("pk"))
+                .order_by()
+            ),
+            batch_size=1000,
+        )
@@ -0,0 +1,177 @@
+import datetime
+import itertools
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+
+from plans.models import MonthlyPlan
+from users.models import User
+
+from .models import Payment
+from .rollups import rebuild_rollups
+
+# 지출 종류별 (가중치, 최소 금액, 최대 금액)
+PAY_TYPE_PROFILES = {
+    Payment.PayChoices.FOOD: (30, 5000, 40000),
+    Payment.PayChoices.CAFE: (18, 2000, 12000),
+    Payment.PayChoices.CLOTHES: (4, 20000, 200000),
+    Payment.PayChoices.PHONE: (1, 30000, 90000),
+    Payment.PayChoices.TRANSPORT: (15, 1200, 30000),
+    Payment.PayChoices.TRAVEL: (2, 50000, 800000),
+    Payment.PayChoices.CULTURE: (6, 8000, 60000),
+    Payment.PayChoices.HEALTH: (4, 5000, 100000),
+    Payment.PayChoices.BEAUTY: (4, 10000, 80000),
+    Payment.PayChoices.EDUCATION: (2, 20000, 300000),
+    Payment.PayChoices.PRESENT: (4, 10000, 150000),
+    Payment.PayChoices.ETC: (10, 1000, 50000),
+}
+
+DISTRIBUTIONS = ("uniform", "recent", "weekend")
+
+PAYMENT_COLUMNS = (
+    "owner_id",
+    "pay_type",
+    "pay_title",
+    "pay_content",
+    "pay_price",
+    "pay_date",
+)
+
+
+def user_random(seed, user_index, purpose):
+    """
+    사용자별 난수 생성기 (프로세스 수와 관계없이 같은 seed면 같은 데이터 생성)
+    """
+    return random.Random(f"{seed}:{user_index}:{purpose}")
+
+
+def _pick_day(rng, days, distribution, end_date):
+    if distribution == "recent":
+        # 최근 날짜일수록 지출이 많음
+        return int(days * (1 - rng.random() ** 0.5))
+    if distribution == "weekend":
+        # 주말 지출이 평일의 3배
+        while True:
+            day = rng.randrange(days)
+            weekday = (end_date - datetime.timedelta(days=day)).weekday()
+            if weekday >= 5 or rng.random() < 1 / 3:
+                return day
+    return rng.randrange(days)
+
+
+def generate_payments(user_id, count, end_date, days, rng, distribution="uniform"):
+    """
+    end_date 이전 days일 동안의 지출 내역 count건을 PAYMENT_COLUMNS 순서의 tuple로 생성
+    """
+    pay_types = list(PAY_TYPE_PROFILES)
+    weights = list(
+        itertools.accumulate(profile[0] for profile in PAY_TYPE_PROFILES.values())
+    )
+    labels = {pay_type: pay_type.label for pay_type in pay_types}
+
+    # DB 드라이버에 넘길 날짜 값은 날짜별로 한 번만 변환
+    adapt_date = connection.ops.adapt_datefield_value
+    dates = [
+        adapt_date(end_date - datetime.timedelta(days=day)) for day in range(days)
+    ]
+
+    for index in range(count):
+        pay_type = rng.choices(pay_types, cum_weights=weights)[0]
+        _, low, high = PAY_TYPE_PROFILES[pay_type]
+        yield (
+            user_id,
+            pay_type.value,
+            f"{labels[pay_type]} {index}",
+            "",
+            rng.randrange(low, high + 1, 100),
+            dates[_pick_day(rng, days, distribution, end_date)],
+        )
+
+
+def insert_payments(rows, batch_size):
+    """
+    지출 내역 tuple을 batch_size개씩 executemany로 저장
+
+    수천만 건을 만들 때는 bulk_create의 모델 인스턴스 생성과 필드별 변환 비용이
+    대부분을 차지하므로, 같은 INSERT 문을 tuple로 바로 실행
+    """
+    quote_name = connection.ops.quote_name
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        quote_name(Payment._meta.db_table),
+        ", ".join(quote_name(column) for column in PAYMENT_COLUMNS),
+        ", ".join(["%s"] * len(PAYMENT_COLUMNS)),
+    )
+
+    rows = iter(rows)
+    total = 0
+    with connection.cursor() as cursor:
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                return total
+            with transaction.atomic():
+                cursor.executemany(sql, batch)
+            total += len(batch)
+
+
+def create_users(prefix, indexes, seed, password="budget_password"):
+    """
+    사용자와 한 달 예산 계획 생성 (비밀번호 해시는 한 번만 계산)
+    """
+    password = make_password(password)
+    users = User.objects.bulk_create(
+        User(
+            username=f"{prefix}{index:07d}",
+            name=f"사용자{index}",
+            password=password,
+        )
+        for index in indexes
+    )
+
+    plans = []
+    for index, user in zip(indexes, users):
+        rng = user_random(seed, index, "plan")
+        monthly_income = rng.randrange(1500000, 8000000, 10000)
+        monthly_saving = rng.randrange(0, monthly_income // 2, 10000)
+        plans.append(
+            MonthlyPlan(
+                owner=user,
+                monthly_income=monthly_income,
+                monthly_saving=monthly_saving,
+                monthly_possible=monthly_income - monthly_saving,
+            )
+        )
+    MonthlyPlan.objects.bulk_create(plans)
+    return users
+
+
+def seed_user_payments(
+    users,
+    indexes,
+    payments_per_user,
+    end_date,
+    days,
+    seed=0,
+    distribution="uniform",
+    batch_size=5000,
+    rollups=True,
+):
+    """
+    사용자별 지출 내역을 생성해 batch 단위로 저장하고 지출 집계를 갱신
+    """
+    payments = itertools.chain.from_iterable(
+        generate_payments(
+            user.pk,
+            payments_per_user,
+            end_date,
+            days,
+            user_random(seed, index, "payments"),
+            distribution,
+        )
+        for index, user in zip(indexes, users)
+    )
+    total = insert_payments(payments, batch_size)
+    if rollups:
+        rebuild_rollups(users)
+    return total
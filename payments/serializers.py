@@ -31,7 +31,7 @@ class PaymentSerializer(serializers.ModelSerializer):
         """
         지출 날짜가 오늘 날짜보다 미래인 경우 ValidationError 발생
         """
-        if value > date.today():
+        if value is not None and value > date.today():
             raise ValidationError("지출 날짜는 오늘 날짜보다 미래일 수 없습니다.")
         return value
 
@@ -0,0 +1,57 @@
+from django.db.models.signals import post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from users.models import User
+
+from . import rollups
+from .models import Payment
+
+
+def _locked(payment, using):
+    # 동시에 같은 지출 내역을 수정/삭제하는 요청은 이 행 잠금에서 차례로 실행
+    return (
+        Payment.objects.using(using)
+        .select_for_update()
+        .filter(pk=payment.pk)
+        .only("owner_id", "pay_type", "pay_price", "pay_date")
+        .first()
+    )
+
+
+@receiver(pre_save, sender=Payment)
+def lock_previous_payment(sender, instance, raw=False, using=None, **kwargs):
+    """
+    수정 전 값을 잠금 상태로 조회 (Payment.save의 트랜잭션 안에서 실행)
+    """
+    instance._rollup_previous = None
+    if not raw and instance.pk is not None and not instance._state.adding:
+        instance._rollup_previous = _locked(instance, using)
+
+
+@receiver(post_save, sender=Payment)
+def apply_saved_payment(sender, instance, raw=False, **kwargs):
+    """
+    관리자 페이지, shell 등 어디서 저장해도 집계 테이블에 반영
+    """
+    previous = instance.__dict__.pop("_rollup_previous", None)
+    if raw:
+        return
+    if previous is None:
+        rollups.payment_added(instance)
+    else:
+        rollups.payment_changed(previous, instance)
+
+
+@receiver(pre_delete, sender=Payment)
+def remove_deleted_payment(sender, instance, using, origin=None, **kwargs):
+    """
+    삭제 전 행을 잠그고 현재 값만큼 차감 (삭제 트랜잭션 안에서 실행)
+
+    이미 다른 요청이 삭제한 행은 차감하지 않음
+    """
+    if isinstance(origin, User):
+        # 사용자 삭제 시 집계 테이블도 함께 삭제됨
+        return
+    current = _locked(instance, using)
+    if current is not None:
+        rollups.payment_removed(current)
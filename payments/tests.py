@@ -1,3 +1,224 @@
+import datetime
+
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
 
-# Create your tests here.
+from rest_framework.test import APIClient
+
+from plans.models import MonthlyPlan
+from users.models import User
+
+from .models import Payment
+from .utils import month_range
+
+
+class OwnerEndpointQueryTests(TestCase):
+    """
+    본인 지출 내역 조회 API의 쿼리 수 (지출 내역 수와 관계없이 일정해야 함)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("query_owner", "password1", name="쿼리")
+        MonthlyPlan.objects.create(
+            owner=cls.user,
+            monthly_income=2000000,
+            monthly_saving=500000,
+            monthly_possible=1500000,
+        )
+        for index in range(10):
+            Payment.objects.create(
+                owner=cls.user,
+                pay_type=Payment.PayChoices.values[index % 3],
+                pay_title=f"지출 {index}",
+                pay_price=1000 * (index + 1),
+                pay_date=datetime.date(2024, 3, 1 + index % 5),
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assertQueries(self, num, url):
+        with self.assertNumQueries(num):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_monthly_list(self):
+        # 지출 내역 + 월 합계(window 함수)를 한 번에 조회
+        self.assertQueries(1, "/api/v1/payments/query_owner/2024-3/")
+
+    def test_daily_list(self):
+        self.assertQueries(1, "/api/v1/payments/query_owner/2024-3-1/")
+
+    def test_trend(self):
+        # 월별 집계 테이블 한 번
+        self.assertQueries(1, "/api/v1/payments/query_owner/trend/?start=2024-01")
+
+    def test_type_summary(self):
+        # 지출 종류별 집계 + 예산 계획
+        self.assertQueries(2, "/api/v1/payments/query_owner/2024-3/by-type/")
+
+    def test_detail(self):
+        # 지출 내역만 조회 (작성자는 로그인 사용자를 그대로 사용)
+        payment = Payment.objects.filter(owner=self.user).first()
+        self.assertQueries(1, f"/api/v1/payments/{payment.pk}/")
+
+
+class PaymentIndexTests(TestCase):
+    """
+    월별 지출 조회(pay_date 범위)가 (owner, pay_date) 복합 인덱스를 사용하는지
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("index_owner", "password1", name="인덱스")
+        cls.start_date, cls.end_date = month_range(2024, 2)
+
+    def month_payments(self, **filters):
+        return Payment.objects.filter(
+            owner=self.user,
+            pay_date__gte=self.start_date,
+            pay_date__lt=self.end_date,
+            **filters,
+        )
+
+    @skipUnless(connection.vendor == "sqlite", "SQLite 실행 계획")
+    def test_sqlite_month_range(self):
+        plan = self.month_payments().explain()
+        self.assertIn("USING INDEX payment_owner_date_idx", plan)
+
+    @skipUnless(connection.vendor == "sqlite", "SQLite 실행 계획")
+    def test_sqlite_month_range_by_type(self):
+        plan = self.month_payments(pay_type=Payment.PayChoices.FOOD).explain()
+        self.assertIn("USING INDEX payment_owner_type_date_idx", plan)
+
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL 실행 계획")
+    def test_postgresql_month_range(self):
+        # 테스트 테이블은 행이 적어 seq scan이 선택되므로 비활성화하고 확인
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        self.assertIn("payment_owner_date_idx", self.month_payments().explain())
+        self.assertIn(
+            "payment_owner_type_date_idx",
+            self.month_payments(pay_type=Payment.PayChoices.FOOD).explain(),
+        )
+
+
+class ConditionalGetTests(TestCase):
+    """
+    ETag/Last-Modified 조건부 조회 (304는 view의 404/403/400 검사를 가리지 않아야 함)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("etag_owner", "password1", name="이태그")
+        cls.other = User.objects.create_user("etag_other", "password1", name="남")
+        cls.other_payment = Payment.objects.create(
+            owner=cls.other,
+            pay_title="남의 지출",
+            pay_price=1000,
+            pay_date=datetime.date(2024, 3, 1),
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_payment(self, price):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/v1/payments/new/",
+                {"pay_title": "지출", "pay_price": price, "pay_date": "2024-03-05"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+
+    def test_unchanged_etag(self):
+        url = "/api/v1/payments/etag_owner/2024-3/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_changed_after_write(self):
+        url = "/api/v1/payments/etag_owner/2024-3/"
+        self.create_payment(1000)
+        response = self.client.get(url)
+        self.assertEqual(response.json()["이번 달 총 지출 금액"], 1000)
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        # 같은 초 안의 수정도 Last-Modified를 바꿔야 함
+        self.create_payment(2000)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["이번 달 총 지출 금액"], 3000)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["Last-Modified"], last_modified)
+
+    def test_errors_are_not_hidden_by_304(self):
+        # "*"와 미래 시각은 어떤 ETag/Last-Modified와도 일치
+        preconditions = {
+            "HTTP_IF_NONE_MATCH": "*",
+            "HTTP_IF_MODIFIED_SINCE": "Fri, 01 Jan 2100 00:00:00 GMT",
+        }
+        cases = {
+            "/api/v1/payments/etag_other/2024-3/": 403,
+            "/api/v1/payments/etag_owner/2024-13/": 400,
+            "/api/v1/payments/etag_owner/2024-2-30/": 400,
+            "/api/v1/payments/99999999/": 404,
+            f"/api/v1/payments/{self.other_payment.pk}/": 403,
+        }
+        for url, status_code in cases.items():
+            for header, value in preconditions.items():
+                with self.subTest(url=url, header=header):
+                    response = self.client.get(url, **{header: value})
+                    self.assertEqual(response.status_code, status_code)
+
+
+class PaymentAdminQueryTests(TestCase):
+    """
+    지출 내역 관리자 목록의 쿼리 수 (행마다 사용자를 조회하지 않아야 함)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser("payment_admin", "password1")
+        owners = User.objects.bulk_create(
+            User(username=f"admin_owner_{index}", name=f"사용자 {index}")
+            for index in range(20)
+        )
+        Payment.objects.bulk_create(
+            Payment(
+                owner=owners[index % len(owners)],
+                pay_type=Payment.PayChoices.values[index % 3],
+                pay_title=f"지출 {index}",
+                pay_price=1000,
+                pay_date=datetime.date(2024, 1 + index % 12, 1 + index % 28),
+            )
+            for index in range(300)
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_changelist(self):
+        # 세션 + 관리자 + 개수(추정) + 목록(select_related)
+        for query in (
+            "",
+            "?pay_type__exact=Food",
+            "?pay_date__gte=2024-01-01&pay_date__lt=2025-01-01",
+        ):
+            with self.subTest(query=query):
+                with self.assertNumQueries(4):
+                    response = self.client.get(f"/admin/payments/payment/{query}")
+                self.assertEqual(response.status_code, 200)
@@ -4,15 +4,36 @@ from . import views
 
 urlpatterns = [
     path("new/", views.NewPaymentView.as_view(), name="create_payment"),
+    path("bulk/", views.BulkPaymentView.as_view(), name="bulk_create_payment"),
     path(
         "<str:owner>/<int:year>-<int:month>/",
         views.PaymentMonthlyListView.as_view(),
         name="monthly_payment",
     ),
+    path(
+        "<str:owner>/<int:year>-<int:month>/async/",
+        views.PaymentMonthlyListAsyncView.as_view(),
+        name="monthly_payment_async",
+    ),
+    path(
+        "<str:owner>/<int:year>-<int:month>/by-type/",
+        views.PaymentTypeSummaryView.as_view(),
+        name="payment_type_summary",
+    ),
     path(
         "<str:owner>/<int:year>-<int:month>-<int:day>/",
         views.PaymentDailyListView.as_view(),
         name="daily_payment",
     ),
+    path(
+        "<str:owner>/trend/",
+        views.PaymentTrendView.as_view(),
+        name="payment_trend",
+    ),
+    path(
+        "<str:owner>/export/",
+        views.PaymentExportView.as_view(),
+        name="export_payment",
+    ),
     path("<int:pk>/", views.PaymentDetailView.as_view(), name="detail_payment"),
 ]
@@ -1,6 +1,13 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+import asyncio
+import csv
 import datetime
+import io
 
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -8,11 +15,25 @@ from rest_framework import status
 from rest_framework import permissions
 from rest_framework.exceptions import NotFound, PermissionDenied, ParseError
 
-from .models import Payment
+from . import rollups
+from .export import EXPORT_CONTENT_TYPES, EXPORT_STREAMS, ExportContentNegotiation
+from .models import MonthlySpending, Payment
+from .pagination import PaymentCursorPagination
 from .serializers import PaymentSerializer
-
+from .utils import (
+    apayments_with_total,
+    iter_months,
+    month_range,
+    months_between,
+    parse_month,
+    payments_with_total,
+)
+
+from plans.cache import aconditional_get, bump_data_version, conditional_get
 from plans.models import MonthlyPlan, TodayPlan
-from users.models import User
+from users.permissions import IsOwner
+
+from config.async_views import AsyncOwnerView
 
 
 class NewPaymentView(APIView):
@@ -41,8 +62,9 @@ class NewPaymentView(APIView):
             if not pay_date:
                 serializer.validated_data["pay_date"] = timezone.localtime().date()
 
+            # 집계 테이블은 payments.signals에서 갱신
             payment = serializer.save(owner=request.user)
-            
+
             return Response(
                 {
                     "payment_pk": payment.pk,
@@ -59,64 +81,415 @@ class NewPaymentView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class BulkPaymentView(APIView):
+    """
+    POST : 지출 내역 일괄 입력 (JSON 배열 또는 CSV 파일 업로드)
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response(
+            {
+                "message": "지출 내역 목록(JSON 배열) 또는 CSV 파일(file)을 입력해주세요.",
+                "csv_header": "pay_type,pay_title,pay_content,pay_price,pay_date",
+            }
+        )
+
+    def get_rows(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            return request.data
+
+        try:
+            text = upload.read().decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise ParseError("CSV 파일은 UTF-8 형식이어야 합니다.")
+
+        # 빈 칸은 입력하지 않은 것으로 보고 기본값 적용
+        return [
+            {key: value for key, value in row.items() if key and value}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+
+    def post(self, request):
+        rows = self.get_rows(request)
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {"message": "지출 내역 목록을 입력해주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        max_rows = getattr(settings, "PAYMENT_BULK_MAX_ROWS", 5000)
+        if len(rows) > max_rows:
+            return Response(
+                {"message": f"한 번에 {max_rows}건까지 입력할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = PaymentSerializer(data=rows, many=True)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    "message": "입력 값이 올바르지 않은 지출 내역이 있습니다.",
+                    "errors": [
+                        {"row": index, "errors": errors}
+                        for index, errors in enumerate(serializer.errors, start=1)
+                        if errors
+                    ],
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        today = timezone.localtime().date()
+        payments = []
+        for data in serializer.validated_data:
+            if not data.get("pay_date"):
+                data["pay_date"] = today
+            payments.append(Payment(owner=request.user, **data))
+
+        with transaction.atomic():
+            payments = Payment.objects.bulk_create(
+                payments,
+                batch_size=getattr(settings, "PAYMENT_BULK_BATCH_SIZE", 500),
+            )
+            # bulk_create는 post_save 시그널을 보내지 않으므로 직접 반영
+            rollups.apply_payments(payments)
+            transaction.on_commit(lambda: bump_data_version(request.user.pk))
+
+        return Response(
+            {
+                "owner": request.user.name,
+                "message": f"{len(payments)}건의 지출 내역이 저장되었습니다.",
+                "payment_pks": [payment.pk for payment in payments],
+                "지출 금액 합계": sum(payment.pay_price for payment in payments),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
 class PaymentMonthlyListView(APIView):
     """
     GET : 한 달 지출 내역 조회 (yyyy-mm 입력)
+          ?page_size=, ?cursor= 입력 시 (pay_date, pk) 순서로 페이지 단위 조회
     """
 
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
 
+    @conditional_get
     def get(self, request, owner, year, month):
-        if request.user.username != owner:
-            raise PermissionDenied("접근 권한이 없습니다.")
+        try:
+            start_date, end_date = month_range(year, month)
+        except ValueError:
+            return Response(
+                {"message": "해당 월을 조회할 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        user = get_object_or_404(User, username=owner)
+        user = request.user
         payments = Payment.objects.filter(
-            owner=user, pay_date__year=year, pay_date__month=month
+            owner=user, pay_date__gte=start_date, pay_date__lt=end_date
         )
 
-        total_pay_price = sum(payment.pay_price for payment in payments)
+        paginator = PaymentCursorPagination()
+        if paginator.is_requested(request):
+            payment_list, next_url = paginator.paginate(payments, request, user.name)
+            return Response(
+                {
+                    "이번 달 총 지출 금액": rollups.month_total(user, start_date),
+                    "지출 내역": payment_list,
+                    "next": next_url,
+                },
+                status=status.HTTP_200_OK,
+            )
 
-        serializer = PaymentSerializer(payments, many=True)
+        total_pay_price, payment_list = payments_with_total(payments, user.name)
 
         return Response(
             {
                 "이번 달 총 지출 금액": total_pay_price,
-                "지출 내역": serializer.data,
+                "지출 내역": payment_list,
             },
             status=status.HTTP_200_OK,
         )
 
 
+class PaymentMonthlyListAsyncView(AsyncOwnerView):
+    """
+    GET : 한 달 지출 내역 조회 (async, PaymentMonthlyListView와 같은 응답)
+    """
+
+    @aconditional_get
+    async def get(self, request, owner, year, month):
+        try:
+            start_date, end_date = month_range(year, month)
+        except ValueError:
+            return self.render(
+                {"message": "해당 월을 조회할 수 없습니다."},
+                status.HTTP_400_BAD_REQUEST,
+            )
+
+        user = request.user
+        payments = Payment.objects.filter(
+            owner=user, pay_date__gte=start_date, pay_date__lt=end_date
+        )
+
+        paginator = PaymentCursorPagination()
+        if paginator.is_requested(request):
+            # 한 페이지 조회와 이번 달 합계 조회를 동시에 실행
+            (payment_list, next_url), month_total = await asyncio.gather(
+                paginator.apaginate(payments, request, user.name),
+                rollups.amonth_total(user, start_date),
+            )
+            return self.render(
+                {
+                    "이번 달 총 지출 금액": month_total,
+                    "지출 내역": payment_list,
+                    "next": next_url,
+                }
+            )
+
+        total_pay_price, payment_list = await apayments_with_total(
+            payments, user.name
+        )
+
+        return self.render(
+            {
+                "이번 달 총 지출 금액": total_pay_price,
+                "지출 내역": payment_list,
+            }
+        )
+
+
 class PaymentDailyListView(APIView):
     """
     GET : 하루 지출 내역 조회 (yyyy-mm-dd 입력)
     """
 
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
 
+    @conditional_get
     def get(self, request, owner, year, month, day):
-        if request.user.username != owner:
-            raise PermissionDenied("접근 권한이 없습니다.")
+        try:
+            url_date = datetime.date(year, month, day)
+        except ValueError:
+            return Response(
+                {"message": "해당 일을 조회할 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        user = get_object_or_404(User, username=owner)
-        payments = Payment.objects.filter(
-            owner=user, pay_date__year=year, pay_date__month=month, pay_date__day=day
+        user = request.user
+        payments = Payment.objects.filter(owner=user, pay_date=url_date)
+
+        total_pay_price, payment_list = payments_with_total(payments, user.name)
+
+        return Response(
+            {
+                "오늘 총 지출 금액": total_pay_price,
+                "지출 내역": payment_list,
+            },
+            status=status.HTTP_200_OK,
         )
 
-        total_pay_price = sum(payment.pay_price for payment in payments)
 
-        serializer = PaymentSerializer(payments, many=True)
+class PaymentTypeSummaryView(APIView):
+    """
+    GET : 지출 종류별 총 지출 금액, 건수, 예산 대비 비율 조회 (yyyy-mm 입력)
+          ?end=yyyy-mm 입력 시 yyyy-mm 부터 end 까지 여러 달을 합산
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
+
+    @conditional_get
+    def get(self, request, owner, year, month):
+        try:
+            start_month = datetime.date(year, month, 1)
+            end_month = request.query_params.get("end")
+            end_month = parse_month(end_month) if end_month else start_month
+        except ValueError:
+            return Response(
+                {"message": "해당 월을 조회할 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if end_month < start_month:
+            return Response(
+                {"message": "end는 시작 월보다 이전일 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 월별 집계 테이블에서 지출 종류별로 한 번에 합산
+        totals = {
+            row["pay_type"]: row
+            for row in MonthlySpending.objects.filter(
+                owner=request.user, month__gte=start_month, month__lte=end_month
+            )
+            .values("pay_type")
+            .annotate(total=Sum("total_price"), payment_count=Sum("count"))
+            .order_by()
+        }
+        total_spending = sum(row["total"] for row in totals.values())
+
+        monthly_plan = MonthlyPlan.objects.filter(owner=request.user).first()
+        budget = None
+        if monthly_plan:
+            budget = monthly_plan.monthly_possible * months_between(
+                start_month, end_month
+            )
+
+        pay_types = []
+        for pay_type, label in Payment.PayChoices.choices:
+            row = totals.get(pay_type, {})
+            total = row.get("total", 0)
+            pay_types.append(
+                {
+                    "pay_type": pay_type,
+                    "label": label,
+                    "total": total,
+                    "count": row.get("payment_count", 0),
+                    "share_of_spending": (
+                        round(total / total_spending * 100, 1) if total_spending else 0
+                    ),
+                    "share_of_budget": (
+                        round(total / budget * 100, 1) if budget else None
+                    ),
+                }
+            )
 
         return Response(
             {
-                "오늘 총 지출 금액": total_pay_price,
-                "지출 내역": serializer.data,
+                "start_month (시작 월)": f"{start_month:%Y-%m}",
+                "end_month (종료 월)": f"{end_month:%Y-%m}",
+                "budget (기간 예산)": budget,
+                "total_spending (총 지출 금액)": total_spending,
+                "pay_types (지출 종류별 내역)": pay_types,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class PaymentTrendView(APIView):
+    """
+    GET : 월별 지출 추이 조회 (?start=yyyy-mm&end=yyyy-mm, 기본 최근 12개월)
+          ?by_type=true 입력 시 지출 종류별 금액 포함
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
+    max_months = 120
+
+    @conditional_get
+    def get(self, request, owner):
+        this_month = timezone.localtime().date().replace(day=1)
+        try:
+            end_month = request.query_params.get("end")
+            end_month = parse_month(end_month) if end_month else this_month
+            start_month = request.query_params.get("start")
+            if start_month:
+                start_month = parse_month(start_month)
+            else:
+                start_month = end_month.replace(year=end_month.year - 1)
+                start_month = month_range(start_month.year, start_month.month)[1]
+        except ValueError:
+            return Response(
+                {"message": "월은 yyyy-mm 형식으로 입력해주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        months = months_between(start_month, end_month)
+        if not 0 < months <= self.max_months:
+            return Response(
+                {"message": f"조회 기간은 1~{self.max_months}개월이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        by_type = request.query_params.get("by_type") in ("true", "1")
+        group_by = ("month", "pay_type") if by_type else ("month",)
+
+        # 월별 집계 테이블에서 월(및 지출 종류)별로 한 번에 합산
+        rows = (
+            MonthlySpending.objects.filter(
+                owner=request.user, month__gte=start_month, month__lte=end_month
+            )
+            .values(*group_by)
+            .annotate(total=Sum("total_price"), payment_count=Sum("count"))
+            .order_by()
+        )
+
+        trend = {
+            month: {"month": f"{month:%Y-%m}", "total": 0, "count": 0}
+            for month in iter_months(start_month, end_month)
+        }
+        if by_type:
+            for item in trend.values():
+                item["pay_types"] = dict.fromkeys(Payment.PayChoices.values, 0)
+
+        for row in rows:
+            item = trend[row["month"]]
+            item["total"] += row["total"]
+            item["count"] += row["payment_count"]
+            if by_type:
+                item["pay_types"][row["pay_type"]] = row["total"]
+
+        return Response(
+            {
+                "start_month (시작 월)": f"{start_month:%Y-%m}",
+                "end_month (종료 월)": f"{end_month:%Y-%m}",
+                "total_spending (총 지출 금액)": sum(
+                    item["total"] for item in trend.values()
+                ),
+                "months (월별 지출 내역)": list(trend.values()),
             },
             status=status.HTTP_200_OK,
         )
 
 
+class PaymentExportView(APIView):
+    """
+    GET : 지출 내역 내보내기 (?start=yyyy-mm-dd&end=yyyy-mm-dd&format=csv|ndjson)
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
+    content_negotiation_class = ExportContentNegotiation
+
+    def get(self, request, owner):
+        file_format = request.query_params.get("format", "csv")
+        if file_format not in EXPORT_STREAMS:
+            return Response(
+                {"message": "format은 csv 또는 ndjson 이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            start_date = request.query_params.get("start")
+            end_date = request.query_params.get("end")
+            if start_date:
+                start_date = datetime.date.fromisoformat(start_date)
+            if end_date:
+                end_date = datetime.date.fromisoformat(end_date)
+        except ValueError:
+            return Response(
+                {"message": "날짜는 yyyy-mm-dd 형식으로 입력해주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        payments = Payment.objects.filter(owner=request.user)
+        if start_date:
+            payments = payments.filter(pay_date__gte=start_date)
+        if end_date:
+            payments = payments.filter(pay_date__lte=end_date)
+
+        response = StreamingHttpResponse(
+            EXPORT_STREAMS[file_format](payments, request.user.name),
+            content_type=EXPORT_CONTENT_TYPES[file_format],
+        )
+        filename = "-".join(
+            str(value) for value in ("payments", owner, start_date, end_date) if value
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{filename}.{file_format}"'
+        )
+        return response
+
+
 class PaymentDetailView(APIView):
     """
     GET : 지출 내역 상세 조회
@@ -129,9 +502,11 @@ class PaymentDetailView(APIView):
     def get_object(self, request, pk):
         payment = get_object_or_404(Payment, pk=pk)
 
-        if payment.owner != request.user:
+        if payment.owner_id != request.user.pk:
             raise PermissionDenied("본인만 접근 가능합니다.")
 
+        # 시리얼라이저의 owner.name 조회 시 사용자를 다시 불러오지 않도록 함
+        payment.owner = request.user
         return payment
 
     def get(self, request, pk):
@@ -143,6 +518,7 @@ class PaymentDetailView(APIView):
         payment = self.get_object(request, pk)
         serializer = PaymentSerializer(payment, data=request.data, partial=True)
         if serializer.is_valid():
+            # 집계 테이블은 저장 트랜잭션에서 잠근 수정 전 값으로 갱신 (payments.signals)
             serializer.save()
             return Response(
                 {
@@ -161,6 +537,7 @@ class PaymentDetailView(APIView):
 
     def delete(self, request, pk):
         payment = self.get_object(request, pk)
+        # 이미 삭제된 행은 집계 테이블에서 차감하지 않음 (payments.signals)
         payment.delete()
         return Response(
             {"message": "지출 내역이 삭제되었습니다."}, status=status.HTTP_204_NO_CONTENT
@@ -1,6 +1,8 @@
 from django.contrib import admin
 from .models import MonthlyPlan, TodayPlan
 
+from config.paginator import EstimatedCountPaginator
+
 
 @admin.register(MonthlyPlan)
 class MonthlyPlanAdmin(admin.ModelAdmin):
@@ -13,6 +15,10 @@ class MonthlyPlanAdmin(admin.ModelAdmin):
         "monthly_possible",
     )
     list_display_links = ("pk", "owner")
+    list_select_related = ("owner",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    raw_id_fields = ("owner",)
 
 
 @admin.register(TodayPlan)
@@ -25,3 +31,7 @@ class TodayPlanAdmin(admin.ModelAdmin):
         "date",
     )
     list_display_links = ("pk", "owner")
+    list_select_related = ("owner",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    raw_id_fields = ("owner", "today_spending")
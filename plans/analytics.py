@@ -0,0 +1,179 @@
+import calendar
+import datetime
+
+import numpy as np
+
+from payments.models import DailySpending, Payment
+
+from .models import MonthlyPlan
+
+# 지출 종류 → 배열의 지출 종류 축 index
+PAY_TYPES = list(Payment.PayChoices.values)
+CATEGORY_CODES = {pay_type: code for code, pay_type in enumerate(PAY_TYPES)}
+
+# 지출 종류별 하루 사용 가능 금액을 나눌 때 비율을 계산하는 기간 (일)
+SHARE_LOOKBACK_DAYS = 90
+
+
+def load_daily_spending(owner_ids, start_date, end_date):
+    """
+    start_date ~ end_date (포함) 사용자별 일별/지출 종류별 지출 합계를
+    (사용자, 날짜, 지출 종류) 배열로 조회 (DailySpending 집계 한 번의 쿼리)
+
+    사용자 축은 owner_ids 순서, 날짜 축은 start_date 부터의 일수
+    """
+    owner_index = {owner_id: index for index, owner_id in enumerate(owner_ids)}
+    days = (end_date - start_date).days + 1
+    spending = np.zeros((len(owner_ids), days, len(PAY_TYPES)), dtype=np.int64)
+
+    rows = DailySpending.objects.filter(
+        owner_id__in=owner_ids, date__gte=start_date, date__lte=end_date
+    ).values_list("owner_id", "date", "pay_type", "total_price")
+    owners, dates, codes, prices = [], [], [], []
+    for owner_id, date, pay_type, total_price in rows:
+        owners.append(owner_index[owner_id])
+        dates.append((date - start_date).days)
+        codes.append(CATEGORY_CODES[pay_type])
+        prices.append(total_price)
+
+    # (사용자, 날짜, 지출 종류)는 DailySpending에서 unique
+    spending[owners, dates, codes] = prices
+    return spending
+
+
+def date_axis(start_date, days):
+    """
+    날짜 축의 일자, 해당 월의 일수, 같은 월 첫 날짜의 index
+    (start_date가 월 중간이면 그 달은 start_date 부터)
+    """
+    dates = np.datetime64(start_date, "D") + np.arange(days)
+    months = dates.astype("datetime64[M]")
+    month_starts = months.astype("datetime64[D]")
+    day_of_month = (dates - month_starts).astype(np.int64) + 1
+    days_in_month = ((months + 1).astype("datetime64[D]") - month_starts).astype(
+        np.int64
+    )
+    month_start_index = np.searchsorted(dates, month_starts)
+    return day_of_month, days_in_month, month_start_index
+
+
+def daily_possible(monthly_possible, present_payments, remaining):
+    """
+    today_possible의 배열 버전 (100원 단위 반올림, 남은 예산이 없으면 0)
+    """
+    possible_present = monthly_possible - present_payments
+    possible = np.round(possible_present / remaining / 100) * 100
+    return np.where(possible_present < 0, 0, possible).astype(np.int64)
+
+
+def budget_curves(spending, start_date, monthly_possible):
+    """
+    (사용자, 날짜, 지출 종류) 지출 배열에서 날짜별 예산 지표를 한 번에 계산
+
+    monthly_possible: 사용자별 한 달 사용 가능 금액 (사용자,) 배열
+    반환하는 배열은 모두 (사용자, 날짜) 형태이고 allocation만 (사용자, 날짜, 지출 종류)
+    - month_to_date: 해당 날짜까지 이번 달 누적 지출
+    - today_possible: 하루 사용 가능 금액 (TodayPlanView와 같은 계산)
+    - burn_rate: 이번 달 하루 평균 지출
+    - projected: burn_rate로 계산한 예상 월말 지출
+    - allocation: 하루 사용 가능 금액을 최근 SHARE_LOOKBACK_DAYS일 지출 종류별
+      비율로 나눈 금액 (100원 단위, 지출이 없으면 균등 분배)
+    """
+    users, days, categories = spending.shape
+    day_of_month, days_in_month, month_start_index = date_axis(start_date, days)
+
+    # 월이 바뀌면 누적 지출을 0부터 다시 계산
+    cumulative = np.cumsum(spending.sum(axis=2), axis=1)
+    month_base = np.where(
+        month_start_index > 0, cumulative[:, month_start_index - 1], 0
+    )
+    month_to_date = cumulative - month_base
+
+    remaining = days_in_month - day_of_month + 1
+    possible = daily_possible(
+        np.asarray(monthly_possible)[:, None], month_to_date, remaining
+    )
+    burn_rate = month_to_date / day_of_month
+    projected = month_to_date + burn_rate * (days_in_month - day_of_month)
+
+    # 최근 SHARE_LOOKBACK_DAYS일 (해당 날짜 포함) 지출 종류별 합계
+    by_type = np.cumsum(spending, axis=1)
+    if days > SHARE_LOOKBACK_DAYS:
+        by_type[:, SHARE_LOOKBACK_DAYS:] -= by_type[:, :-SHARE_LOOKBACK_DAYS].copy()
+    type_total = by_type.sum(axis=2, keepdims=True)
+    shares = np.divide(
+        by_type,
+        type_total,
+        out=np.full(by_type.shape, 1 / categories),
+        where=type_total > 0,
+    )
+    allocation = (np.round(possible[:, :, None] * shares / 100) * 100).astype(np.int64)
+
+    return {
+        "month_to_date": month_to_date,
+        "today_possible": possible,
+        "burn_rate": burn_rate,
+        "projected": projected,
+        "allocation": allocation,
+    }
+
+
+def month_forecast(owner, as_of):
+    """
+    as_of 기준 이번 달 누적 지출, 예상 월말 지출, 하루 평균 지출,
+    지출 종류별 하루 사용 가능 금액 (예산 계획이 없으면 None)
+    """
+    monthly_possible = (
+        MonthlyPlan.objects.filter(owner=owner)
+        .order_by("pk")
+        .values_list("monthly_possible", flat=True)
+        .first()
+    )
+    if monthly_possible is None:
+        return None
+
+    month_start = as_of.replace(day=1)
+    start_date = min(
+        month_start, as_of - datetime.timedelta(days=SHARE_LOOKBACK_DAYS - 1)
+    )
+    spending = load_daily_spending([owner.pk], start_date, as_of)
+    curves = budget_curves(spending, start_date, [monthly_possible])
+
+    month_to_date = curves["month_to_date"][0, (month_start - start_date).days :]
+    burn_rate = float(curves["burn_rate"][0, -1])
+    projected = round(float(curves["projected"][0, -1]))
+    _, last_day = calendar.monthrange(as_of.year, as_of.month)
+
+    days = [
+        {
+            "date": month_start + datetime.timedelta(days=offset),
+            "cumulative": int(total),
+            "projected": False,
+        }
+        for offset, total in enumerate(month_to_date.tolist())
+    ]
+    # 기준일 이후는 하루 평균 지출로 예상한 누적 지출
+    spent = days[-1]["cumulative"]
+    days += [
+        {
+            "date": as_of + datetime.timedelta(days=offset),
+            "cumulative": round(spent + burn_rate * offset),
+            "projected": True,
+        }
+        for offset in range(1, last_day - as_of.day + 1)
+    ]
+
+    return {
+        "month (월)": f"{month_start:%Y-%m}",
+        "as_of (기준일)": as_of,
+        "monthly_possible (이번 달 사용 가능 한 금액)": monthly_possible,
+        "spent (기준일까지 지출 금액)": spent,
+        "burn_rate (하루 평균 지출 금액)": round(burn_rate),
+        "projected_spending (예상 월말 지출 금액)": projected,
+        "projected_remaining (예상 월말 남는 금액)": monthly_possible - projected,
+        "today_possible (오늘 사용 가능 한 금액)": int(curves["today_possible"][0, -1]),
+        "category_allocation (지출 종류별 하루 사용 가능 금액)": dict(
+            zip(PAY_TYPES, curves["allocation"][0, -1].tolist())
+        ),
+        "days (일별 누적 지출 금액)": days,
+    }
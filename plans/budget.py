@@ -0,0 +1,187 @@
+import calendar
+import datetime
+
+from django.db.models import FilteredRelation, Q, Sum
+
+from payments.models import DailySpending, Payment
+from payments.utils import PAYMENT_FIELDS, month_range, payment_row
+
+from .models import MonthlyPlan
+
+
+def remaining_days(on_date):
+    """
+    해당 월의 남은 일수 (on_date 포함)
+    """
+    _, last_day = calendar.monthrange(on_date.year, on_date.month)
+    return last_day - on_date.day + 1
+
+
+def today_possible(monthly_possible, present_payments, on_date):
+    """
+    하루 사용 가능 금액 (100원 단위 반올림)
+
+    이번 달 남은 예산(monthly_possible - present_payments)을 남은 일수로 나눈 금액,
+    남은 예산이 없으면 0
+    """
+    possible_present = monthly_possible - present_payments
+    if possible_present < 0:
+        return 0
+    return round(possible_present / remaining_days(on_date) / 100) * 100
+
+
+def _budget_totals(owner, on_date):
+    # 이번 달 1일 ~ on_date 의 일별 지출 집계만 LEFT JOIN (계획은 지출이 없어도 조회)
+    month_days = FilteredRelation(
+        "owner__daily_spendings",
+        condition=Q(
+            owner__daily_spendings__date__gte=on_date.replace(day=1),
+            owner__daily_spendings__date__lte=on_date,
+        ),
+    )
+    on_day = Q(month_days__date=on_date)
+    return (
+        MonthlyPlan.objects.filter(owner=owner)
+        .annotate(month_days=month_days)
+        .values("pk", "monthly_possible")
+        .annotate(
+            present_payments=Sum("month_days__total_price"),
+            today_total=Sum("month_days__total_price", filter=on_day),
+            today_count=Sum("month_days__count", filter=on_day),
+        )
+        .order_by("pk")[:1]
+    )
+
+
+def _with_defaults(totals):
+    if totals is not None:
+        for key in ("present_payments", "today_total", "today_count"):
+            totals[key] = totals[key] or 0
+    return totals
+
+
+def budget_totals(owner, on_date):
+    """
+    예산 계획의 사용 가능 금액, 이번 달 누적 지출(on_date 포함), on_date 지출 합계/건수를
+    한 번의 쿼리로 조회 (예산 계획이 없으면 None)
+    """
+    return _with_defaults(next(iter(_budget_totals(owner, on_date)), None))
+
+
+async def abudget_totals(owner, on_date):
+    """
+    budget_totals의 async 버전
+    """
+    return _with_defaults(await _budget_totals(owner, on_date).afirst())
+
+
+def _day_payments(owner, on_date):
+    return (
+        Payment.objects.filter(owner=owner, pay_date=on_date)
+        .order_by("pay_date", "pk")
+        .values(*PAYMENT_FIELDS)
+    )
+
+
+def today_summary(user, on_date):
+    """
+    on_date의 예산 요약 (TodayPlanView 응답), 예산 계획이 없으면 None
+
+    지출 내역은 해당 일에 지출이 있을 때만 조회
+    """
+    totals = budget_totals(user, on_date)
+    if totals is None:
+        return None
+
+    payment_list = []
+    if totals["today_count"]:
+        payment_list = [
+            payment_row(row, user.name) for row in _day_payments(user, on_date)
+        ]
+    return build_today_summary(on_date, totals, payment_list)
+
+
+async def atoday_summary(user, on_date):
+    """
+    today_summary의 async 버전
+    """
+    totals = await abudget_totals(user, on_date)
+    if totals is None:
+        return None
+
+    payment_list = []
+    if totals["today_count"]:
+        payment_list = [
+            payment_row(row, user.name) async for row in _day_payments(user, on_date)
+        ]
+    return build_today_summary(on_date, totals, payment_list)
+
+
+def build_today_summary(on_date, totals, payment_list):
+    monthly_possible = totals["monthly_possible"]
+    present_payments = totals["present_payments"]
+    possible = today_possible(monthly_possible, present_payments, on_date)
+
+    return {
+        "today_date (날짜)": on_date,
+        "monthly_possible (이번 달 사용 가능 한 금액)": monthly_possible,
+        "present_payments (이번 달 현재까지의 사용금액)": present_payments,
+        "possible_present (이번 달 사용 가능 한 금액)": monthly_possible
+        - present_payments,
+        "today_possible (오늘 사용 가능 한 금액)": possible,
+        "today_present (오늘 사용 가능 한 남은 금액)": possible - totals["today_total"],
+        "today_total_spending (오늘 총 지출 금액)": totals["today_total"],
+        "today_payments (사용 내역)": payment_list,
+    }
+
+
+def month_calendar(owner, year, month):
+    """
+    해당 월 모든 날짜의 하루 사용 가능 금액, 지출 합계, 남은 금액
+    (예산 계획이 없으면 None)
+
+    일별 지출 합계를 한 번의 쿼리로 읽고, 각 날짜의 이번 달 누적 지출은
+    날짜 순서대로 더해가며 계산 (TodayPlanView를 날짜마다 호출한 것과 같은 값)
+    """
+    monthly_possible = (
+        MonthlyPlan.objects.filter(owner=owner)
+        .order_by("pk")
+        .values_list("monthly_possible", flat=True)
+        .first()
+    )
+    if monthly_possible is None:
+        return None
+
+    start_date, end_date = month_range(year, month)
+    day_totals = dict(
+        DailySpending.objects.filter(
+            owner=owner, date__gte=start_date, date__lt=end_date
+        )
+        .values("date")
+        .annotate(total=Sum("total_price"))
+        .order_by()
+        .values_list("date", "total")
+    )
+
+    days = []
+    present_payments = 0
+    for offset in range((end_date - start_date).days):
+        on_date = start_date + datetime.timedelta(days=offset)
+        today_total = day_totals.get(on_date, 0)
+        present_payments += today_total
+        possible = today_possible(monthly_possible, present_payments, on_date)
+        days.append(
+            {
+                "date": on_date,
+                "today_possible": possible,
+                "today_total_spending": today_total,
+                "today_present": possible - today_total,
+            }
+        )
+
+    return {
+        "month (월)": f"{start_date:%Y-%m}",
+        "monthly_possible (이번 달 사용 가능 한 금액)": monthly_possible,
+        "total_spending (이번 달 총 지출 금액)": present_payments,
+        "days (일별 예산)": days,
+    }
@@ -0,0 +1,230 @@
+import datetime
+import functools
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from payments.utils import month_range
+
+
+class CacheStats:
+    """
+    예산 요약 캐시 hit/miss 횟수 (프로세스 단위)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def as_dict(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0,
+            }
+
+
+stats = CacheStats()
+
+
+def get_cache():
+    return caches[getattr(settings, "PLAN_CACHE_ALIAS", "default")]
+
+
+def _timeout():
+    return getattr(settings, "PLAN_CACHE_TIMEOUT", 60 * 60)
+
+
+def _version_timeout(cache):
+    # local-memory 캐시는 다른 worker의 버전 갱신을 알 수 없으므로 버전도 만료시켜
+    # 이전 데이터의 캐시/304 응답을 PLAN_CACHE_TIMEOUT 이상 사용하지 않음
+    return _timeout() if isinstance(cache, LocMemCache) else None
+
+
+def _version_key(user_id):
+    return f"plans:version:{user_id}"
+
+
+def data_version(user_id):
+    """
+    사용자 데이터 버전 (마지막으로 지출 내역/예산 계획이 바뀐 시각, ns)
+
+    캐시에 버전이 없으면 현재 시각으로 새로 만들기 때문에,
+    버전이 지워져도 이전 버전의 캐시를 다시 사용하지 않음
+    """
+    cache = get_cache()
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        cache.add(_version_key(user_id), time.time_ns(), _version_timeout(cache))
+        version = cache.get(_version_key(user_id))
+    return version
+
+
+async def adata_version(user_id):
+    """
+    data_version의 async 버전
+    """
+    cache = get_cache()
+    version = await cache.aget(_version_key(user_id))
+    if version is None:
+        await cache.aadd(
+            _version_key(user_id), time.time_ns(), _version_timeout(cache)
+        )
+        version = await cache.aget(_version_key(user_id))
+    return version
+
+
+def bump_data_version(user_id):
+    """
+    사용자 데이터 버전 갱신 (해당 사용자의 캐시 무효화)
+    """
+    cache = get_cache()
+    version = cache.get(_version_key(user_id)) or 0
+    # Last-Modified는 초 단위이므로 같은 초에 다시 갱신해도 다음 초로 넘김
+    # (If-Modified-Since만 보내는 요청에 이전 데이터로 304를 반환하지 않음)
+    cache.set(
+        _version_key(user_id),
+        max(time.time_ns(), (version // 10**9 + 1) * 10**9),
+        _version_timeout(cache),
+    )
+
+
+def cached_summary(user_id, name, compute):
+    """
+    사용자 데이터 버전별로 compute() 결과를 캐시 (None은 캐시하지 않음)
+    """
+    cache = get_cache()
+    key = f"plans:{name}:{user_id}:{data_version(user_id)}"
+
+    value = cache.get(key)
+    stats.record(value is not None)
+    if value is None:
+        value = compute()
+        if value is not None:
+            cache.set(key, value, _timeout())
+    return value
+
+
+async def acached_summary(user_id, name, compute):
+    """
+    cached_summary의 async 버전 (compute는 coroutine 함수)
+    """
+    cache = get_cache()
+    key = f"plans:{name}:{user_id}:{await adata_version(user_id)}"
+
+    value = await cache.aget(key)
+    stats.record(value is not None)
+    if value is None:
+        value = await compute()
+        if value is not None:
+            await cache.aset(key, value, _timeout())
+    return value
+
+
+def _validators(request, version):
+    """
+    사용자 데이터 버전으로 만든 (ETag, Last-Modified)
+    """
+    # 이번 달/오늘 기준으로 계산하는 응답이 있으므로 날짜가 바뀌면 새 ETag
+    today = timezone.localdate()
+    etag = quote_etag(
+        hashlib.md5(f"{version}:{today}:{request.get_full_path()}".encode()).hexdigest()
+    )
+    midnight = timezone.make_aware(datetime.datetime.combine(today, datetime.time.min))
+    last_modified = max(version // 10**9, int(midnight.timestamp()))
+    return etag, last_modified
+
+
+def _set_validators(response, etag, last_modified):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _is_own_page(user, kwargs):
+    return user.is_authenticated and kwargs.get("owner") == user.username
+
+
+def _valid_url_date(kwargs):
+    """
+    URL의 yyyy-mm(-dd)가 조회할 수 있는 날짜인지 (잘못된 날짜는 view에서 400 반환)
+    """
+    if "year" not in kwargs:
+        return True
+    try:
+        month_range(kwargs["year"], kwargs["month"])
+        datetime.date(kwargs["year"], kwargs["month"], kwargs.get("day", 1))
+    except ValueError:
+        return False
+    return True
+
+
+def conditional_get(view_method):
+    """
+    사용자 데이터 버전으로 ETag/Last-Modified를 만들고,
+    If-None-Match/If-Modified-Since가 일치하면 view를 실행하지 않고 304 반환
+
+    URL의 owner가 로그인한 사용자가 아니거나 URL의 날짜가 잘못된 경우
+    그대로 view를 실행 (권한/입력 값 검사는 view에서, 304로 404/403/400을 가리지 않음)
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        if not _is_own_page(request.user, kwargs) or not _valid_url_date(kwargs):
+            return view_method(self, request, *args, **kwargs)
+
+        etag, last_modified = _validators(request, data_version(request.user.pk))
+        response = get_conditional_response(
+            request._request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        return _set_validators(response, etag, last_modified)
+
+    return wrapper
+
+
+def aconditional_get(view_method):
+    """
+    conditional_get의 async view (django View) 버전
+    """
+
+    @functools.wraps(view_method)
+    async def wrapper(self, request, *args, **kwargs):
+        if not _is_own_page(request.user, kwargs) or not _valid_url_date(kwargs):
+            return await view_method(self, request, *args, **kwargs)
+
+        version = await adata_version(request.user.pk)
+        etag, last_modified = _validators(request, version)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = await view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        return _set_validators(response, etag, last_modified)
+
+    return wrapper
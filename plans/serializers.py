@@ -7,6 +7,7 @@ from .models import MonthlyPlan, TodayPlan
 
 from payments.models import Payment
 from payments.serializers import PaymentSerializer
+from payments.utils import month_range
 
 class MonthlyPlanSerializer(serializers.ModelSerializer):
     owner = serializers.ReadOnlyField(source="owner.name")
@@ -74,10 +75,11 @@ class TodayPlanSerializer(serializers.ModelSerializer):
         monthly_plan = MonthlyPlan.objects.get(owner=obj.owner)
         total_spent_this_month = 0
 
+        start_date, end_date = month_range(obj.date.year, obj.date.month)
         payments_this_month = Payment.objects.filter(
             owner=obj.owner,
-            pay_date__month=obj.date.month,
-            pay_date__year=obj.date.year,
+            pay_date__gte=start_date,
+            pay_date__lt=end_date,
         )
         
         for payment in payments_this_month:
@@ -0,0 +1,28 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from payments.models import Payment
+from users.models import User
+
+from .cache import bump_data_version
+from .models import MonthlyPlan
+
+
+def _bump_on_commit(user_id):
+    # 커밋 전에 갱신하면 다른 요청이 이전 데이터를 새 버전으로 캐시할 수 있음
+    transaction.on_commit(lambda: bump_data_version(user_id))
+
+
+@receiver(post_save, sender=Payment)
+@receiver(post_delete, sender=Payment)
+@receiver(post_save, sender=MonthlyPlan)
+@receiver(post_delete, sender=MonthlyPlan)
+def invalidate_owner_cache(sender, instance, **kwargs):
+    _bump_on_commit(instance.owner_id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    # 캐시된 응답에 사용자 이름(owner)이 포함됨
+    _bump_on_commit(instance.pk)
@@ -1,3 +1,409 @@
-from django.test import TestCase
+import datetime
 
-# Create your tests here.
+import numpy as np
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from payments.models import Payment
+from users.models import User
+
+from .analytics import PAY_TYPES, SHARE_LOOKBACK_DAYS, budget_curves
+from .budget import budget_totals, remaining_days, today_possible, today_summary
+from .models import MonthlyPlan, TodayPlan
+
+
+class OwnerEndpointQueryTests(TestCase):
+    """
+    본인 예산 계획 조회 API의 쿼리 수 (캐시되지 않은 요청 기준)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("plan_owner", "password1", name="예산")
+        MonthlyPlan.objects.create(
+            owner=cls.user,
+            monthly_income=2000000,
+            monthly_saving=500000,
+            monthly_possible=1500000,
+        )
+        cls.today = timezone.localdate()
+        for index in range(5):
+            Payment.objects.create(
+                owner=cls.user,
+                pay_title=f"지출 {index}",
+                pay_price=1000 * (index + 1),
+                pay_date=cls.today,
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assertQueries(self, num, url):
+        with self.assertNumQueries(num):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_monthly_plan(self):
+        # 예산 계획 + 이번 달 집계
+        self.assertQueries(2, "/api/v1/plans/monthly/plan_owner/")
+
+    def test_today_plan(self):
+        # 예산/집계 합계 한 번 + 지출이 있는 날만 지출 내역 한 번
+        today = self.today
+        url = f"/api/v1/plans/plan_owner/{today.year}-{today.month}-{today.day}/"
+        self.assertQueries(2, url)
+
+    def test_today_plan_without_payments(self):
+        day = self.today - datetime.timedelta(days=40)
+        self.assertQueries(
+            1, f"/api/v1/plans/plan_owner/{day.year}-{day.month}-{day.day}/"
+        )
+
+    def test_cached_summary(self):
+        url = "/api/v1/plans/monthly/plan_owner/"
+        self.client.get(url)
+        self.assertQueries(0, url)
+
+
+class ConditionalGetTests(TestCase):
+    """
+    예산 계획 조회 API의 조건부 조회 (304는 view의 403/400 검사를 가리지 않아야 함)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("etag_plan", "password1", name="이태그")
+        User.objects.create_user("etag_plan_other", "password1", name="남")
+        MonthlyPlan.objects.create(
+            owner=cls.user,
+            monthly_income=1000000,
+            monthly_saving=0,
+            monthly_possible=1000000,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_unchanged_etag(self):
+        url = "/api/v1/plans/etag_plan/2024-3/calendar/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_changed_after_write(self):
+        url = "/api/v1/plans/etag_plan/2024-3-5/"
+        response = self.client.get(url)
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Payment.objects.create(
+                owner=self.user,
+                pay_title="지출",
+                pay_price=31000,
+                pay_date=datetime.date(2024, 3, 5),
+            )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["today_total_spending (오늘 총 지출 금액)"], 31000
+        )
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+
+    def test_errors_are_not_hidden_by_304(self):
+        preconditions = {
+            "HTTP_IF_NONE_MATCH": "*",
+            "HTTP_IF_MODIFIED_SINCE": "Fri, 01 Jan 2100 00:00:00 GMT",
+        }
+        cases = {
+            "/api/v1/plans/monthly/etag_plan_other/": 403,
+            "/api/v1/plans/etag_plan_other/2024-3-5/": 403,
+            "/api/v1/plans/etag_plan/2024-2-30/": 400,
+            "/api/v1/plans/etag_plan/2024-13/calendar/": 400,
+            "/api/v1/plans/etag_plan/0-1/forecast/": 400,
+        }
+        for url, status_code in cases.items():
+            for header, value in preconditions.items():
+                with self.subTest(url=url, header=header):
+                    response = self.client.get(url, **{header: value})
+                    self.assertEqual(response.status_code, status_code)
+
+
+class BudgetTests(TestCase):
+    """
+    하루 사용 가능 금액 계산 (plans.budget)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("budget_owner", "password1", name="예산")
+        MonthlyPlan.objects.create(
+            owner=cls.user,
+            monthly_income=1000000,
+            monthly_saving=400000,
+            monthly_possible=600000,
+        )
+        for price, pay_date in (
+            (3000, datetime.date(2024, 2, 29)),
+            (1000, datetime.date(2024, 3, 2)),
+            (1000, datetime.date(2024, 3, 5)),
+            (2500, datetime.date(2024, 3, 5)),
+            (9000, datetime.date(2024, 3, 6)),
+        ):
+            Payment.objects.create(
+                owner=cls.user,
+                pay_title="지출",
+                pay_price=price,
+                pay_date=pay_date,
+            )
+
+    def test_remaining_days(self):
+        self.assertEqual(remaining_days(datetime.date(2024, 3, 1)), 31)
+        self.assertEqual(remaining_days(datetime.date(2024, 3, 15)), 17)
+        self.assertEqual(remaining_days(datetime.date(2024, 2, 1)), 29)
+        self.assertEqual(remaining_days(datetime.date(2023, 2, 28)), 1)
+        self.assertEqual(remaining_days(datetime.date(2024, 12, 31)), 1)
+
+    def test_today_possible_rounds_to_100(self):
+        # 55000 / 31 = 1774.19... -> 1800
+        self.assertEqual(today_possible(55000, 0, datetime.date(2024, 3, 1)), 1800)
+        # 50000 / 31 = 1612.90... -> 1600
+        self.assertEqual(today_possible(50000, 0, datetime.date(2024, 3, 1)), 1600)
+        # 남은 예산 / 남은 일수 (마지막 날은 남은 예산 전부)
+        self.assertEqual(
+            today_possible(600000, 590000, datetime.date(2024, 3, 31)), 10000
+        )
+
+    def test_today_possible_overspent(self):
+        self.assertEqual(today_possible(600000, 600000, datetime.date(2024, 3, 5)), 0)
+        self.assertEqual(today_possible(600000, 700000, datetime.date(2024, 3, 5)), 0)
+
+    def test_budget_totals_without_plan(self):
+        user = User.objects.create_user("no_plan", "password1", name="계획없음")
+        with self.assertNumQueries(1):
+            self.assertIsNone(budget_totals(user, datetime.date(2024, 3, 5)))
+
+    def test_budget_totals_without_spending(self):
+        with self.assertNumQueries(1):
+            totals = budget_totals(self.user, datetime.date(2024, 3, 4))
+        self.assertEqual(totals["monthly_possible"], 600000)
+        # 지난 달(2월) 지출은 포함하지 않음
+        self.assertEqual(totals["present_payments"], 1000)
+        self.assertEqual(totals["today_total"], 0)
+        self.assertEqual(totals["today_count"], 0)
+
+        # 지출이 없는 날은 지출 내역을 조회하지 않음
+        with self.assertNumQueries(1):
+            summary = today_summary(self.user, datetime.date(2024, 3, 4))
+        self.assertEqual(summary["today_payments (사용 내역)"], [])
+
+    def test_budget_totals_with_spending(self):
+        with self.assertNumQueries(1):
+            totals = budget_totals(self.user, datetime.date(2024, 3, 5))
+        # 다음 날(3월 6일) 지출은 포함하지 않음
+        self.assertEqual(totals["present_payments"], 4500)
+        self.assertEqual(totals["today_total"], 3500)
+        self.assertEqual(totals["today_count"], 2)
+
+        summary = today_summary(self.user, datetime.date(2024, 3, 5))
+        # (600000 - 4500) / 27 = 22055.5... -> 22100
+        self.assertEqual(summary["today_possible (오늘 사용 가능 한 금액)"], 22100)
+        self.assertEqual(summary["today_present (오늘 사용 가능 한 남은 금액)"], 18600)
+        self.assertEqual(len(summary["today_payments (사용 내역)"]), 2)
+
+
+class BudgetCurvesTests(SimpleTestCase):
+    """
+    numpy 예산 지표 계산 (plans.analytics.budget_curves)
+    """
+
+    def spending(self, start_date, days, payments):
+        spending = np.zeros((1, days, len(PAY_TYPES)), dtype=np.int64)
+        for pay_date, pay_type, price in payments:
+            offset = (pay_date - start_date).days
+            spending[0, offset, PAY_TYPES.index(pay_type)] += price
+        return spending
+
+    def test_month_to_date_resets_at_month_start(self):
+        # 월 중간부터 시작해도 다음 달 1일에 누적 지출을 다시 계산
+        start_date = datetime.date(2024, 1, 20)
+        spending = self.spending(
+            start_date,
+            20,
+            [
+                (datetime.date(2024, 1, 25), "Food", 1000),
+                (datetime.date(2024, 2, 1), "Cafe", 500),
+                (datetime.date(2024, 2, 3), "Food", 300),
+            ],
+        )
+        curves = budget_curves(spending, start_date, [600000])
+        month_to_date = curves["month_to_date"][0].tolist()
+
+        self.assertEqual(month_to_date[:5], [0] * 5)
+        self.assertEqual(month_to_date[5:12], [1000] * 7)  # 1월 25일 ~ 31일
+        self.assertEqual(month_to_date[12:14], [500, 500])  # 2월 1일 ~ 2일
+        self.assertEqual(month_to_date[14:], [800] * 6)
+
+    def test_today_possible_matches_budget(self):
+        start_date = datetime.date(2024, 2, 15)
+        payments = [
+            (start_date + datetime.timedelta(days=offset), "Food", 7300 * offset)
+            for offset in range(0, 60, 3)
+        ]
+        spending = self.spending(start_date, 60, payments)
+        curves = budget_curves(spending, start_date, [300000])
+
+        present_payments = 0
+        for offset in range(60):
+            on_date = start_date + datetime.timedelta(days=offset)
+            if on_date.day == 1:
+                present_payments = 0
+            present_payments += int(spending[0, offset].sum())
+            self.assertEqual(
+                curves["today_possible"][0, offset],
+                today_possible(300000, present_payments, on_date),
+            )
+
+    def test_share_window_drops_old_days(self):
+        start_date = datetime.date(2024, 1, 1)
+        days = SHARE_LOOKBACK_DAYS + 20
+        spending = self.spending(
+            start_date,
+            days,
+            [
+                (start_date, "Food", 10000),
+                (start_date + datetime.timedelta(days=days - 1), "Cafe", 1000),
+            ],
+        )
+        curves = budget_curves(spending, start_date, [3000000])
+        allocation = curves["allocation"][0]
+        possible = curves["today_possible"][0]
+        food, cafe = PAY_TYPES.index("Food"), PAY_TYPES.index("Cafe")
+
+        # 90일째(0일 포함)까지는 식비 지출만 있음
+        last_food_day = SHARE_LOOKBACK_DAYS - 1
+        self.assertEqual(allocation[last_food_day, food], possible[last_food_day])
+        self.assertEqual(allocation[last_food_day].sum(), possible[last_food_day])
+        # 마지막 날은 식비가 기간에서 빠지고 카페 지출만 남음
+        self.assertEqual(allocation[-1, food], 0)
+        self.assertEqual(allocation[-1, cafe], possible[-1])
+
+    def test_no_spending_splits_evenly(self):
+        start_date = datetime.date(2024, 3, 1)
+        spending = self.spending(start_date, 31, [])
+        curves = budget_curves(spending, start_date, [3720000])
+
+        # 3720000 / 31 = 120000 -> 지출 종류 12개에 10000씩
+        self.assertEqual(curves["today_possible"][0, 0], 120000)
+        self.assertEqual(curves["allocation"][0, 0].tolist(), [10000] * 12)
+        self.assertEqual(curves["burn_rate"][0].tolist(), [0.0] * 31)
+
+
+class MonthlyForecastViewTests(TestCase):
+    """
+    월말 지출 예측 API
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("forecast", "password1", name="예측")
+        MonthlyPlan.objects.create(
+            owner=cls.user,
+            monthly_income=1000000,
+            monthly_saving=0,
+            monthly_possible=1000000,
+        )
+        for day, price in ((1, 12000), (3, 4500), (10, 30000)):
+            Payment.objects.create(
+                owner=cls.user,
+                pay_title="지출",
+                pay_price=price,
+                pay_date=datetime.date(2024, 3, day),
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_invalid_as_of(self):
+        url = "/api/v1/plans/forecast/2024-3/forecast/"
+        for as_of in ("2024-04-01", "2024-02-29", "2024-3-x", "20240305"):
+            with self.subTest(as_of=as_of):
+                response = self.client.get(url, {"as_of": as_of})
+                self.assertEqual(response.status_code, 400)
+
+    def test_without_plan(self):
+        user = User.objects.create_user("no_forecast", "password1", name="없음")
+        self.client.force_authenticate(user)
+        response = self.client.get("/api/v1/plans/no_forecast/2024-3/forecast/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_projection(self):
+        response = self.client.get(
+            "/api/v1/plans/forecast/2024-3/forecast/", {"as_of": "2024-03-10"}
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        days = data["days (일별 누적 지출 금액)"]
+
+        self.assertEqual(data["spent (기준일까지 지출 금액)"], 46500)
+        self.assertEqual(data["burn_rate (하루 평균 지출 금액)"], 4650)
+        self.assertEqual(len(days), 31)
+        self.assertEqual(
+            days[9], {"date": "2024-03-10", "cumulative": 46500, "projected": False}
+        )
+        self.assertTrue(days[10]["projected"])
+        self.assertEqual(
+            days[-1]["cumulative"], data["projected_spending (예상 월말 지출 금액)"]
+        )
+        self.assertEqual(data["projected_spending (예상 월말 지출 금액)"], 144150)
+
+
+class PlanAdminQueryTests(TestCase):
+    """
+    예산 계획 관리자 목록의 쿼리 수 (행마다 사용자를 조회하지 않아야 함)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser("plan_admin", "password1")
+        owners = User.objects.bulk_create(
+            User(username=f"plan_admin_owner_{index}", name=f"사용자 {index}")
+            for index in range(50)
+        )
+        MonthlyPlan.objects.bulk_create(
+            MonthlyPlan(
+                owner=owner,
+                monthly_income=2000000,
+                monthly_saving=500000,
+                monthly_possible=1500000,
+            )
+            for owner in owners
+        )
+        TodayPlan.objects.bulk_create(
+            TodayPlan(owner=owner, today_possible=50000) for owner in owners
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_changelist(self):
+        # 세션 + 관리자 + 개수(추정) + 목록(select_related)
+        for url in ("/admin/plans/monthlyplan/", "/admin/plans/todayplan/"):
+            with self.subTest(url=url):
+                with self.assertNumQueries(4):
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
@@ -5,7 +5,21 @@ from . import views
 urlpatterns = [
     path("monthly/", views.MonthlyPlanView.as_view()),
     path("monthly/<str:owner>/", views.MonthlyPlanDetailView.as_view()),
+    path("monthly/<str:owner>/async/", views.MonthlyPlanDetailAsyncView.as_view()),
+    path("cache/stats/", views.PlanCacheStatsView.as_view()),
     path(
         "<str:owner>/<int:year>-<int:month>-<int:day>/", views.TodayPlanView.as_view()
     ),
+    path(
+        "<str:owner>/<int:year>-<int:month>/calendar/",
+        views.MonthlyCalendarView.as_view(),
+    ),
+    path(
+        "<str:owner>/<int:year>-<int:month>/forecast/",
+        views.MonthlyForecastView.as_view(),
+    ),
+    path(
+        "<str:owner>/<int:year>-<int:month>-<int:day>/async/",
+        views.TodayPlanAsyncView.as_view(),
+    ),
 ]
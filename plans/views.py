@@ -1,8 +1,7 @@
-import calendar
-from django.db.models import Sum
+import asyncio
 
 from django.utils import timezone
-from datetime import datetime
+from datetime import datetime, timedelta
 from django.shortcuts import get_object_or_404
 
 from rest_framework.response import Response
@@ -11,13 +10,25 @@ from rest_framework import status
 from rest_framework import permissions
 from rest_framework.exceptions import NotFound, PermissionDenied, ParseError
 
+from .analytics import month_forecast
+from .budget import atoday_summary, month_calendar, today_summary
+from .cache import (
+    acached_summary,
+    aconditional_get,
+    cached_summary,
+    conditional_get,
+    stats,
+)
 from .models import MonthlyPlan, TodayPlan
 from .serializers import MonthlyPlanSerializer, TodayPlanSerializer
 
 from payments.serializers import PaymentSerializer, MonthlyPaymentSerializer
 
-from payments.models import Payment
-from users.models import User
+from payments import rollups
+from payments.utils import month_range
+from users.permissions import IsOwner
+
+from config.async_views import AsyncOwnerView
 
 
 class MonthlyPlanView(APIView):
@@ -76,31 +87,30 @@ class MonthlyPlanDetailView(APIView):
     DELETE : 한 달 예산 계획 삭제
     """
 
-    permission_classes = [permissions.IsAuthenticated]
-
-    def get_object(self, request, username):
-        user = get_object_or_404(User, username=username)
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
 
-        if user != request.user:
-            raise PermissionDenied("접근 권한이 없습니다.")
-
-        return get_object_or_404(MonthlyPlan, owner=user)
+    def get_object(self, request):
+        return get_object_or_404(MonthlyPlan, owner=request.user)
 
+    @conditional_get
     def get(self, request, owner):
-        monthly_plan = self.get_object(request, owner)
+        user = request.user
 
         today = timezone.localtime().date()
-        current_year = today.year
-        current_month = today.month
-
-        month_total_spending = (
-            Payment.objects.filter(
-                owner=request.user,
-                pay_date__year=current_year,
-                pay_date__month=current_month,
-            ).aggregate(total=Sum("pay_price"))["total"]
-            or 0
+        data = cached_summary(
+            user.pk, f"monthly:{today}", lambda: self.get_summary(user, today)
         )
+        return Response(data, status=status.HTTP_200_OK)
+
+    def get_summary(self, user, today):
+        monthly_plan = get_object_or_404(MonthlyPlan, owner=user)
+        month_total_spending = rollups.month_total(user, today)
+        return self.build_summary(user, monthly_plan, month_total_spending)
+
+    @staticmethod
+    def build_summary(user, monthly_plan, month_total_spending):
+        # 시리얼라이저의 owner.name 조회 시 사용자를 다시 불러오지 않도록 함
+        monthly_plan.owner = user
 
         serializer = MonthlyPlanSerializer(monthly_plan)
         data = serializer.data
@@ -116,10 +126,10 @@ class MonthlyPlanDetailView(APIView):
         current_monthly_possible = round(current_monthly_possible / 100) * 100
         data["monthly_possible"] = current_monthly_possible
 
-        return Response(data, status=status.HTTP_200_OK)
+        return data
 
     def put(self, request, owner):
-        monthly_plan = self.get_object(request, owner)
+        monthly_plan = self.get_object(request)
         serializer = MonthlyPlanSerializer(
             monthly_plan, data=request.data, partial=True
         )
@@ -140,7 +150,7 @@ class MonthlyPlanDetailView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def delete(self, request, owner):
-        monthly_plan = self.get_object(request, owner)
+        monthly_plan = self.get_object(request)
         monthly_plan.delete()
 
         return Response(
@@ -154,13 +164,11 @@ class TodayPlanView(APIView):
     GET : 오늘 사용 내역 및 사용 가능 금액 조회
     """
 
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
 
+    @conditional_get
     def get(self, request, owner, year, month, day):
-        user = get_object_or_404(User, username=owner)
-
-        if user != request.user:
-            raise PermissionDenied("접근 권한이 없습니다.")
+        user = request.user
 
         try:
             url_date = datetime(year, month, day).date()
@@ -170,58 +178,167 @@ class TodayPlanView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # 지정된 날짜의 지출 내역 구하기
-        payments = Payment.objects.filter(owner=user, pay_date=url_date)
-        total_pay_price = sum(payment.pay_price for payment in payments)
-
-        # 이번 달 예산 조회
-        monthly_plan = MonthlyPlan.objects.filter(owner=user).first()
-        if not monthly_plan:
+        data = cached_summary(
+            user.pk, f"today:{url_date}", lambda: self.get_summary(user, url_date)
+        )
+        if data is None:
             return Response(
                 {"message": "이번 달 예산 계획이 설정되지 않았습니다."}, status=status.HTTP_404_NOT_FOUND
             )
-        else:
-            monthly_possible = monthly_plan.monthly_possible
-
-        # 해당 월의 총 일수와 현재 날짜 구하기
-        _, last_day = calendar.monthrange(url_date.year, url_date.month)
-        remaining_days = last_day - url_date.day + 1
-
-        present_payments = (
-            Payment.objects.filter(
-                owner=user,
-                pay_date__year=url_date.year,
-                pay_date__month=url_date.month,
-                pay_date__lte=url_date,
-            ).aggregate(Sum("pay_price"))["pay_price__sum"]
-            or 0
+        return Response(data, status=status.HTTP_200_OK)
+
+    def get_summary(self, user, url_date):
+        return today_summary(user, url_date)
+
+
+class MonthlyCalendarView(APIView):
+    """
+    GET : 한 달 달력용 일별 예산 조회 (yyyy-mm 입력)
+          날짜별 하루 사용 가능 금액, 지출 합계, 남은 금액 (TodayPlanView와 같은 계산)
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
+
+    @conditional_get
+    def get(self, request, owner, year, month):
+        user = request.user
+
+        try:
+            month_range(year, month)
+        except ValueError:
+            return Response(
+                {"message": "해당 월을 조회할 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        data = cached_summary(
+            user.pk,
+            f"calendar:{year}-{month}",
+            lambda: month_calendar(user, year, month),
         )
+        if data is None:
+            return Response(
+                {"message": "이번 달 예산 계획이 설정되지 않았습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(data, status=status.HTTP_200_OK)
 
-        # 남은 일수에 따른 하루 사용 가능 금액 계산
-        today_possible = (monthly_possible - present_payments) / remaining_days
-        today_possible = round(today_possible / 100) * 100
 
-        possible_present = monthly_possible - present_payments
+class MonthlyForecastView(APIView):
+    """
+    GET : 월말 지출 예측 (yyyy-mm 입력, ?as_of=yyyy-mm-dd 기준일, 기본값 오늘)
+          기준일까지 누적 지출, 하루 평균 지출, 예상 월말 지출,
+          지출 종류별 하루 사용 가능 금액
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
+
+    @conditional_get
+    def get(self, request, owner, year, month):
+        user = request.user
+
+        try:
+            start_date, end_date = month_range(year, month)
+        except ValueError:
+            return Response(
+                {"message": "해당 월을 조회할 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        if possible_present >= 0:
-            today_possible = possible_present / remaining_days
+        as_of = request.query_params.get("as_of")
+        if as_of:
+            try:
+                as_of = datetime.strptime(as_of, "%Y-%m-%d").date()
+            except ValueError:
+                as_of = None
+            if as_of is None or not start_date <= as_of < end_date:
+                return Response(
+                    {"message": "기준일은 해당 월의 날짜여야 합니다."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
         else:
-            today_possible = 0
+            # 지난 달은 말일, 다음 달 이후는 1일 기준
+            today = timezone.localtime().date()
+            as_of = min(max(today, start_date), end_date - timedelta(days=1))
 
-        today_possible = round(today_possible / 100) * 100
+        data = cached_summary(
+            user.pk, f"forecast:{as_of}", lambda: month_forecast(user, as_of)
+        )
+        if data is None:
+            return Response(
+                {"message": "이번 달 예산 계획이 설정되지 않았습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(data, status=status.HTTP_200_OK)
 
-        today_present = today_possible - total_pay_price
 
-        return Response(
-            {
-                "today_date (날짜)": url_date,
-                "monthly_possible (이번 달 사용 가능 한 금액)": monthly_possible,
-                "present_payments (이번 달 현재까지의 사용금액)": present_payments,
-                "possible_present (이번 달 사용 가능 한 금액)": possible_present,
-                "today_possible (오늘 사용 가능 한 금액)": today_possible,
-                "today_present (오늘 사용 가능 한 남은 금액)": today_present,
-                "today_total_spending (오늘 총 지출 금액)": total_pay_price,
-                "today_payments (사용 내역)": PaymentSerializer(payments, many=True).data,
-            },
-            status=status.HTTP_200_OK,
+class MonthlyPlanDetailAsyncView(AsyncOwnerView):
+    """
+    GET : 한 달 예산 계획 조회 (async, MonthlyPlanDetailView와 같은 응답)
+    """
+
+    @aconditional_get
+    async def get(self, request, owner):
+        user = request.user
+
+        today = timezone.localtime().date()
+        data = await acached_summary(
+            user.pk, f"monthly:{today}", lambda: self.get_summary(user, today)
         )
+        if data is None:
+            raise NotFound()
+        return self.render(data)
+
+    async def get_summary(self, user, today):
+        # 예산 계획과 이번 달 지출 합계를 동시에 조회
+        monthly_plan, month_total_spending = await asyncio.gather(
+            MonthlyPlan.objects.filter(owner=user).afirst(),
+            rollups.amonth_total(user, today),
+        )
+        if monthly_plan is None:
+            return None
+        return MonthlyPlanDetailView.build_summary(
+            user, monthly_plan, month_total_spending
+        )
+
+
+class TodayPlanAsyncView(AsyncOwnerView):
+    """
+    GET : 오늘 사용 내역 및 사용 가능 금액 조회 (async, TodayPlanView와 같은 응답)
+    """
+
+    @aconditional_get
+    async def get(self, request, owner, year, month, day):
+        user = request.user
+
+        try:
+            url_date = datetime(year, month, day).date()
+        except ValueError:
+            return self.render(
+                {"message": "해당 일을 조회할 수 없습니다."},
+                status.HTTP_400_BAD_REQUEST,
+            )
+
+        data = await acached_summary(
+            user.pk, f"today:{url_date}", lambda: self.get_summary(user, url_date)
+        )
+        if data is None:
+            return self.render(
+                {"message": "이번 달 예산 계획이 설정되지 않았습니다."},
+                status.HTTP_404_NOT_FOUND,
+            )
+        return self.render(data)
+
+    async def get_summary(self, user, url_date):
+        return await atoday_summary(user, url_date)
+
+
+class PlanCacheStatsView(APIView):
+    """
+    GET : 예산 요약 캐시 hit/miss 횟수 조회 (관리자)
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(stats.as_dict(), status=status.HTTP_200_OK)
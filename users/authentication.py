@@ -0,0 +1,37 @@
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+
+
+async def aauthenticate(request):
+    """
+    async view용 사용자 인증 (세션 또는 JWT Authorization 헤더)
+
+    인증되지 않은 경우 None 반환
+    """
+    user = await request.auser()
+    if user.is_authenticated:
+        return user
+
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    if header is None:
+        return None
+
+    # 토큰 검증은 서명/만료만 확인하므로 DB 조회가 없음
+    # "Bearer", "Bearer a b" 같은 잘못된 헤더도 인증 실패(401)로 처리
+    try:
+        raw_token = authentication.get_raw_token(header)
+        if raw_token is None:
+            return None
+        token = authentication.get_validated_token(raw_token)
+        user_id = token[api_settings.USER_ID_CLAIM]
+    except (AuthenticationFailed, KeyError):
+        return None
+
+    user = await User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).afirst()
+    if user is None or not user.is_active:
+        return None
+    return user
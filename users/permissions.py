@@ -0,0 +1,17 @@
+from rest_framework import permissions
+
+
+class IsOwner(permissions.BasePermission):
+    """
+    URL의 owner가 로그인한 사용자인지 확인
+
+    request.user로 이미 불러온 username과 비교하므로 사용자 조회 쿼리가 필요 없음
+    """
+
+    message = "접근 권한이 없습니다."
+
+    def has_permission(self, request, view):
+        return (
+            request.user.is_authenticated
+            and view.kwargs.get("owner") == request.user.username
+        )